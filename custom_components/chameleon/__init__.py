@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
 from pathlib import Path
+from typing import Any, Final
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 
 from .animations import AnimationManager
+from .color_extractor import async_load_color_cache, async_unload_color_cache
 from .const import (
     ATTR_SCENE_NAME,
+    CONF_LIGHT_ENTITIES,
+    CONF_LIGHT_ENTITY,
+    CONFIG_ENTRY_MINOR_VERSION,
+    CONFIG_ENTRY_VERSION,
     DOMAIN,
     IMAGE_DIRECTORY,
     PLATFORMS,
@@ -20,11 +29,33 @@ from .const import (
     SERVICE_START_ANIMATION,
     SERVICE_STOP_ANIMATION,
 )
+from .helpers import async_setup_area_name_cache, async_unload_area_name_cache, get_entry_unique_id
+from .light_controller import get_light_controller
 
 _LOGGER = logging.getLogger(__name__)
 
 type ChameleonConfigEntry = ConfigEntry[None]
 
+_IMAGE_DIR: Final = Path(IMAGE_DIRECTORY)
+
+# hass.data[DOMAIN] keys holding objects shared by all entries (not entry IDs)
+_SHARED_DATA_KEYS: Final = frozenset(
+    {
+        "animation_manager",
+        "area_name_cache",
+        "area_name_cache_unsubs",
+        "extraction_inflight",
+        "light_controller",
+        "palette_cache",
+        "palette_store",
+    }
+)
+
+# Chameleon entity IDs accepted by the services
+# select.chameleon_hallway_scene -> base "hallway"
+_SELECT_RE = re.compile(r"^select\.chameleon_(?P<base>.+?)(?:_scene)?$")
+_SWITCH_RE = re.compile(r"^switch\.chameleon_")
+
 # Service schemas - now target Chameleon entities instead of lights
 SERVICE_APPLY_SCENE_SCHEMA = vol.Schema(
     {
@@ -46,16 +77,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ChameleonConfigEntry) ->
     hass.data.setdefault(DOMAIN, {})
 
     # Create the image directory if it doesn't exist
-    image_dir = Path(IMAGE_DIRECTORY)
-    if not image_dir.exists():
+    if not _IMAGE_DIR.exists():
         _LOGGER.info("Creating Chameleon image directory: %s", IMAGE_DIRECTORY)
-        await hass.async_add_executor_job(image_dir.mkdir, True, True)
+        await hass.async_add_executor_job(_IMAGE_DIR.mkdir, True, True)
 
     # Create shared AnimationManager if not exists
     if "animation_manager" not in hass.data[DOMAIN]:
         hass.data[DOMAIN]["animation_manager"] = AnimationManager(hass)
         _LOGGER.debug("Created AnimationManager")
 
+    # Create shared LightController if not exists
+    get_light_controller(hass)
+
+    # Restore extraction results saved by previous runs (only loads once)
+    await async_load_color_cache(hass)
+
+    # Share area-name lookups between this entry's platforms (only sets up once)
+    async_setup_area_name_cache(hass)
+
     # Store entry data
     hass.data[DOMAIN][entry.entry_id] = {
         "config": entry.data,
@@ -63,7 +102,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ChameleonConfigEntry) ->
 
     # Register services (only once)
     if not hass.services.has_service(DOMAIN, SERVICE_APPLY_SCENE):
-        await _async_register_services(hass)
+        _register_services(hass)
 
     # Forward entry setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -71,6 +110,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ChameleonConfigEntry) ->
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ChameleonConfigEntry) -> bool:
+    """Migrate an old config entry to the current version."""
+    if entry.version > CONFIG_ENTRY_VERSION:
+        # Downgraded from a future version; the entry cannot be understood
+        return False
+
+    if (entry.version, entry.minor_version) < (CONFIG_ENTRY_VERSION, CONFIG_ENTRY_MINOR_VERSION):
+        # Older entries used the joined light entity IDs as their unique ID
+        if CONF_LIGHT_ENTITIES in entry.data:
+            light_entities = entry.data[CONF_LIGHT_ENTITIES]
+        else:
+            light_entities = [entry.data[CONF_LIGHT_ENTITY]]
+
+        hass.config_entries.async_update_entry(
+            entry,
+            unique_id=get_entry_unique_id(light_entities),
+            version=CONFIG_ENTRY_VERSION,
+            minor_version=CONFIG_ENTRY_MINOR_VERSION,
+        )
+        _LOGGER.debug("Migrated entry %s to version %s.%s", entry.entry_id, entry.version, entry.minor_version)
+
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ChameleonConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -78,18 +141,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ChameleonConfigEntry) -
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
 
-        # If no more entries, stop all animations and cleanup
-        remaining_entries = [key for key in hass.data[DOMAIN] if key != "animation_manager"]
+        # If no more entries, stop all animations and drop the shared objects
+        remaining_entries = [key for key in hass.data[DOMAIN] if key not in _SHARED_DATA_KEYS]
         if not remaining_entries:
-            animation_manager: AnimationManager = hass.data[DOMAIN].get("animation_manager")
+            animation_manager: AnimationManager | None = hass.data[DOMAIN].pop("animation_manager", None)
             if animation_manager:
                 await animation_manager.stop_all()
                 _LOGGER.debug("Stopped all animations on last entry unload")
+            hass.data[DOMAIN].pop("light_controller", None)
+            async_unload_area_name_cache(hass)
+            await async_unload_color_cache(hass)
 
     return unload_ok
 
 
-async def _async_register_services(hass: HomeAssistant) -> None:
+def _register_services(hass: HomeAssistant) -> None:
     """Register Chameleon services.
 
     Services now target Chameleon entities instead of raw lights:
@@ -103,7 +169,10 @@ async def _async_register_services(hass: HomeAssistant) -> None:
 
         Targets Chameleon select entities and sets their value to the scene name.
         """
-        entity_ids: list[str] = call.data.get("entity_id", [])
+        # Deduplicate (e.g. from group expansion) while preserving order
+        entity_ids: list[str] = list(dict.fromkeys(call.data.get("entity_id", [])))
+        if not entity_ids:
+            return
         scene_name: str = call.data[ATTR_SCENE_NAME]
 
         _LOGGER.info(
@@ -112,34 +181,39 @@ async def _async_register_services(hass: HomeAssistant) -> None:
             scene_name,
         )
 
-        for entity_id in entity_ids:
-            # Validate this is a Chameleon select entity
-            if not entity_id.startswith("select.chameleon_"):
-                _LOGGER.warning(
-                    "Skipping %s: not a Chameleon select entity",
-                    entity_id,
+        # Validate these are Chameleon select entities
+        select_ids, invalid = _partition(entity_ids, _SELECT_RE)
+        if invalid:
+            _LOGGER.warning("Skipping %s: not Chameleon select entities", invalid)
+
+        # Set the scene on all selects concurrently
+        results = await asyncio.gather(
+            *(
+                hass.services.async_call(
+                    "select",
+                    "select_option",
+                    {
+                        "entity_id": entity_id,
+                        "option": scene_name,
+                    },
+                    blocking=True,
                 )
-                continue
-
-            # Call the select service to set the scene
-            await hass.services.async_call(
-                "select",
-                "select_option",
-                {
-                    "entity_id": entity_id,
-                    "option": scene_name,
-                },
-                blocking=True,
-            )
-            _LOGGER.debug("Applied scene '%s' to %s", scene_name, entity_id)
+                for entity_id in select_ids
+            ),
+            return_exceptions=True,
+        )
+        _check_call_results(select_ids, results, f"apply scene '{scene_name}' to")
 
     async def handle_start_animation(call: ServiceCall) -> None:
         """Handle the start_animation service call.
 
-        Targets Chameleon select entities. Enables the animation switch first,
+        Targets Chameleon select entities. Enables the animation switches first,
         then applies the scene.
         """
-        entity_ids: list[str] = call.data.get("entity_id", [])
+        # Deduplicate (e.g. from group expansion) while preserving order
+        entity_ids: list[str] = list(dict.fromkeys(call.data.get("entity_id", [])))
+        if not entity_ids:
+            return
         scene_name: str = call.data[ATTR_SCENE_NAME]
 
         _LOGGER.info(
@@ -148,67 +222,71 @@ async def _async_register_services(hass: HomeAssistant) -> None:
             scene_name,
         )
 
-        for entity_id in entity_ids:
-            # Validate this is a Chameleon select entity
-            if not entity_id.startswith("select.chameleon_"):
-                _LOGGER.warning(
-                    "Skipping %s: not a Chameleon select entity",
-                    entity_id,
-                )
-                continue
-
-            # Derive the animation switch entity ID from the select entity ID
-            # select.chameleon_hallway_scene -> switch.chameleon_hallway_animation
-            base = entity_id.replace("select.", "").replace("_scene", "")
-            animation_switch_id = f"switch.{base}_animation"
-
-            # Turn on the animation switch
-            await hass.services.async_call(
-                "switch",
-                "turn_on",
-                {"entity_id": animation_switch_id},
-                blocking=True,
-            )
-            _LOGGER.debug("Enabled animation: %s", animation_switch_id)
-
-            # Apply the scene
-            await hass.services.async_call(
-                "select",
-                "select_option",
-                {
-                    "entity_id": entity_id,
-                    "option": scene_name,
-                },
-                blocking=True,
-            )
-            _LOGGER.debug("Applied scene '%s' to %s", scene_name, entity_id)
+        # Validate these are Chameleon select entities
+        select_ids, invalid = _partition(entity_ids, _SELECT_RE)
+        if invalid:
+            _LOGGER.warning("Skipping %s: not Chameleon select entities", invalid)
+
+        # Derive the animation switch entity IDs from the select entity IDs
+        # select.chameleon_hallway_scene -> switch.chameleon_hallway_animation
+        switch_ids = [_SELECT_RE.sub(r"switch.chameleon_\g<base>_animation", entity_id) for entity_id in select_ids]
+
+        if not select_ids:
+            return
+
+        # Both services accept a list of entity IDs, so each phase is a single
+        # batched call: all switches first, then all selects. Errors propagate
+        # to the caller, and a failed switch call skips the scene phase
+        await hass.services.async_call(
+            "switch",
+            "turn_on",
+            {"entity_id": switch_ids},
+            blocking=True,
+        )
+        _LOGGER.debug("Enabled animation: %s", switch_ids)
+
+        await hass.services.async_call(
+            "select",
+            "select_option",
+            {
+                "entity_id": select_ids,
+                "option": scene_name,
+            },
+            blocking=True,
+        )
+        _LOGGER.debug("Applied scene '%s' to %s", scene_name, select_ids)
 
     async def handle_stop_animation(call: ServiceCall) -> None:
         """Handle the stop_animation service call.
 
         Targets Chameleon animation switch entities and turns them off.
         """
-        entity_ids: list[str] = call.data.get("entity_id", [])
+        # Deduplicate (e.g. from group expansion) while preserving order
+        entity_ids: list[str] = list(dict.fromkeys(call.data.get("entity_id", [])))
+        if not entity_ids:
+            return
 
         _LOGGER.info("Service stop_animation: entities=%s", entity_ids)
 
-        for entity_id in entity_ids:
-            # Validate this is a Chameleon switch entity
-            if not entity_id.startswith("switch.chameleon_"):
-                _LOGGER.warning(
-                    "Skipping %s: not a Chameleon switch entity",
-                    entity_id,
+        # Validate these are Chameleon switch entities
+        switch_ids, invalid = _partition(entity_ids, _SWITCH_RE)
+        if invalid:
+            _LOGGER.warning("Skipping %s: not Chameleon switch entities", invalid)
+
+        # Turn off all animation switches concurrently
+        results = await asyncio.gather(
+            *(
+                hass.services.async_call(
+                    "switch",
+                    "turn_off",
+                    {"entity_id": entity_id},
+                    blocking=True,
                 )
-                continue
-
-            # Turn off the animation switch
-            await hass.services.async_call(
-                "switch",
-                "turn_off",
-                {"entity_id": entity_id},
-                blocking=True,
-            )
-            _LOGGER.debug("Stopped animation: %s", entity_id)
+                for entity_id in switch_ids
+            ),
+            return_exceptions=True,
+        )
+        _check_call_results(switch_ids, results, "stop animation")
 
     # Register all services
     hass.services.async_register(
@@ -238,3 +316,46 @@ async def _async_register_services(hass: HomeAssistant) -> None:
         SERVICE_START_ANIMATION,
         SERVICE_STOP_ANIMATION,
     )
+
+
+def _partition(entity_ids: list[str], pattern: re.Pattern[str]) -> tuple[list[str], list[str]]:
+    """Split entity IDs into those matching a pattern and the rest, in one pass.
+
+    Args:
+        entity_ids: Entity IDs to check
+        pattern: Compiled pattern a valid entity ID must match
+
+    Returns:
+        Tuple of (valid entity IDs, invalid entity IDs)
+    """
+    valid: list[str] = []
+    invalid: list[str] = []
+    for entity_id in entity_ids:
+        (valid if pattern.match(entity_id) else invalid).append(entity_id)
+    return valid, invalid
+
+
+def _check_call_results(entity_ids: list[str], results: list[Any], action: str) -> None:
+    """Log the outcome of service calls gathered with return_exceptions=True.
+
+    Every entity's outcome is logged first, so one failure does not hide the
+    others; any failure is then raised to the service caller.
+
+    Args:
+        entity_ids: Entity IDs in the same order as the gathered calls
+        results: Results from asyncio.gather
+        action: Description of the call, e.g. "stop animation"
+
+    Raises:
+        HomeAssistantError: If any of the calls failed
+    """
+    failed: list[str] = []
+    for entity_id, result in zip(entity_ids, results, strict=True):
+        if isinstance(result, BaseException):
+            _LOGGER.error("Failed to %s %s: %s", action, entity_id, result)
+            failed.append(entity_id)
+        else:
+            _LOGGER.debug("Done: %s %s", action, entity_id)
+
+    if failed:
+        raise HomeAssistantError(f"Failed to {action} {', '.join(failed)}")
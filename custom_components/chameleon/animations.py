@@ -5,14 +5,18 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
-from typing import TYPE_CHECKING
+from itertools import cycle
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from homeassistant.components.light import ATTR_BRIGHTNESS, ATTR_RGB_COLOR, ATTR_TRANSITION
 from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_ON
 
 from .const import DEFAULT_TRANSITION_TIME
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from homeassistant.core import HomeAssistant
 
     from .color_extractor import RGBColor
@@ -20,14 +24,88 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+def _service_data_template(light_entity: str | list[str], transition: float, brightness: int | None) -> dict[str, Any]:
+    """Build the light.turn_on data that stays constant across animation ticks.
+
+    Each tick only adds ATTR_RGB_COLOR to a copy of this template. It is copied
+    rather than mutated because Home Assistant keeps a reference to the service
+    data in the call_service event.
+
+    Args:
+        light_entity: Entity ID of the light, or a list of entity IDs
+        transition: Transition time for light changes
+        brightness: Brightness percentage (1-100), converted to 0-255 for HA
+    """
+    service_data: dict[str, Any] = {
+        ATTR_ENTITY_ID: light_entity,
+        ATTR_TRANSITION: transition,
+    }
+    if brightness is not None:
+        service_data[ATTR_BRIGHTNESS] = int((brightness / 100) * 255)
+    return service_data
+
+
+def _next_deadline(next_tick: float, speed: float, now: float) -> float:
+    """Return the loop time of the next animation tick.
+
+    Ticks are scheduled against a fixed cadence so dispatch latency does not
+    stretch the period. If the loop has fallen more than a full tick behind
+    (e.g. the event loop was blocked), the cadence restarts from now instead
+    of firing a burst of catch-up ticks.
+
+    Args:
+        next_tick: Loop time the current tick was scheduled for
+        speed: Seconds between color changes
+        now: Current loop time
+    """
+    next_tick += speed
+    if now - next_tick > speed:
+        return now + speed
+    return next_tick
+
+
+def _rgb_payloads(colors: Sequence[RGBColor]) -> list[list[int]]:
+    """Convert a gradient to rgb_color payload lists in a single pass.
+
+    The gradient is packed into a contiguous uint8 array and unpacked with
+    tolist(), which builds every payload in C and always yields plain ints,
+    even when the colors came from NumPy.
+    """
+    return np.asarray(colors, dtype=np.uint8).reshape(-1, 3).tolist()
+
+
+def _should_log_error(error_count: int) -> bool:
+    """Return True on the 1st, 2nd, 4th, 8th... consecutive error.
+
+    A light that keeps failing (e.g. unreachable) would otherwise log an error
+    on every tick for as long as the animation runs.
+    """
+    return error_count & (error_count - 1) == 0
+
+
 class AnimationController:
     """Controls color animation for a light entity."""
 
+    __slots__ = (
+        "_color_cycle",
+        "_colors_as_lists",
+        "_last_sent",
+        "_running",
+        "_task",
+        "_template",
+        "brightness",
+        "colors",
+        "hass",
+        "light_entity",
+        "speed",
+        "transition",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
         light_entity: str,
-        colors: list[RGBColor],
+        colors: Sequence[RGBColor],
         speed: float,
         transition: float = DEFAULT_TRANSITION_TIME,
         brightness: int | None = None,
@@ -52,7 +130,12 @@ class AnimationController:
 
         self._running = False
         self._task: asyncio.Task | None = None
-        self._current_index = 0
+        self._template = _service_data_template(light_entity, transition, brightness)
+        # rgb_color payloads built once; shared across ticks and never mutated
+        self._colors_as_lists = _rgb_payloads(colors)
+        self._color_cycle = cycle(self._colors_as_lists)
+        # Last color sent to the light, so repeated gradient entries are not resent
+        self._last_sent: list[int] | None = None
 
     @property
     def is_running(self) -> bool:
@@ -93,45 +176,44 @@ class AnimationController:
 
     async def _animation_loop(self) -> None:
         """Main animation loop - cycles through colors."""
-        while self._running:
+        # Bind per-tick lookups to locals once, outside the loop
+        async_call = self.hass.services.async_call
+        template = self._template
+        sleep = asyncio.sleep
+        loop = self.hass.loop
+        next_tick = loop.time()
+        errors = 0
+
+        # Runs until stop() or remove_light() cancels the task
+        while True:
             try:
-                color = self.colors[self._current_index]
-
-                # Build service call data
-                service_data = {
-                    ATTR_ENTITY_ID: self.light_entity,
-                    ATTR_RGB_COLOR: list(color),
-                    ATTR_TRANSITION: self.transition,
-                }
-
-                # Add brightness if specified
-                if self.brightness is not None:
-                    service_data[ATTR_BRIGHTNESS] = int((self.brightness / 100) * 255)
-
-                # Apply color to light with transition
-                await self.hass.services.async_call(
-                    "light",
-                    SERVICE_TURN_ON,
-                    service_data,
-                    blocking=False,
-                )
-
-                # Move to next color
-                self._current_index = (self._current_index + 1) % len(self.colors)
-
-                # Wait before next color change
-                await asyncio.sleep(self.speed)
+                # Apply color to light with transition, unless it already shows it
+                rgb_color = next(self._color_cycle)
+                if rgb_color != self._last_sent:
+                    self._last_sent = None
+                    await async_call("light", SERVICE_TURN_ON, {**template, ATTR_RGB_COLOR: rgb_color}, blocking=False)
+                    self._last_sent = rgb_color
+                errors = 0
+
+                # Wait until the next color change is due
+                next_tick = _next_deadline(next_tick, self.speed, loop.time())
+                await sleep(max(0, next_tick - loop.time()))
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                _LOGGER.error("Error in animation loop for %s: %s", self.light_entity, e)
+                errors += 1
+                if _should_log_error(errors):
+                    _LOGGER.error("Error in animation loop for %s (%d consecutive): %s", self.light_entity, errors, e)
                 await asyncio.sleep(1)  # Brief pause before retry
+                next_tick = loop.time()
 
-    def update_colors(self, colors: list[RGBColor]) -> None:
+    def update_colors(self, colors: Sequence[RGBColor]) -> None:
         """Update the color palette without stopping animation."""
         self.colors = colors
-        self._current_index = 0
+        self._colors_as_lists = _rgb_payloads(colors)
+        self._color_cycle = cycle(self._colors_as_lists)
+        self._last_sent = None
 
     def update_speed(self, speed: float) -> None:
         """Update animation speed."""
@@ -145,11 +227,26 @@ class SynchronizedAnimationController:
     and all lights cycle through colors together in sync.
     """
 
+    __slots__ = (
+        "_colors_as_lists",
+        "_index_cycles",
+        "_last_sent",
+        "_running",
+        "_task",
+        "_template",
+        "brightness",
+        "colors",
+        "hass",
+        "light_entities",
+        "speed",
+        "transition",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
         light_entities: list[str],
-        colors: list[RGBColor],
+        colors: Sequence[RGBColor],
         speed: float,
         transition: float = DEFAULT_TRANSITION_TIME,
         brightness: int | None = None,
@@ -174,13 +271,21 @@ class SynchronizedAnimationController:
 
         self._running = False
         self._task: asyncio.Task | None = None
-        self._current_index = 0
 
         # Calculate offset for each light to distribute colors evenly across the gradient
         num_lights = len(light_entities)
         num_colors = len(colors)
-        # Spread lights evenly across the color gradient
-        self._light_offsets = [(i * num_colors) // num_lights for i in range(num_lights)]
+        # Spread lights evenly across the color gradient; each light cycles through
+        # the color indices starting at its offset, so ticks need no modulo
+        light_offsets = [(i * num_colors) // num_lights for i in range(num_lights)]
+        self._index_cycles = [cycle([*range(offset, num_colors), *range(offset)]) for offset in light_offsets]
+
+        # Service data that does not change between ticks; each call sets its own entity IDs
+        self._template = _service_data_template(light_entities, transition, brightness)
+        # rgb_color payloads built once; shared across ticks and never mutated
+        self._colors_as_lists = _rgb_payloads(colors)
+        # Last color sent to each light, so unchanged lights are skipped on a tick
+        self._last_sent: list[list[int] | None] = [None] * num_lights
 
     @property
     def is_running(self) -> bool:
@@ -219,48 +324,97 @@ class SynchronizedAnimationController:
 
         _LOGGER.info("Stopped synchronized animation for %d lights", len(self.light_entities))
 
+    async def remove_light(self, light_entity: str) -> None:
+        """Stop animating one light while the rest of the group keeps its offsets."""
+        if light_entity not in self.light_entities:
+            return
+
+        # Build new lists rather than mutating: light_entities is shared with the
+        # caller, and the running loop holds the old lists for the current tick.
+        # The remaining index cycles keep their position, so no light jumps
+        keep = [i for i, entity in enumerate(self.light_entities) if entity != light_entity]
+        self.light_entities = [self.light_entities[i] for i in keep]
+        self._index_cycles = [self._index_cycles[i] for i in keep]
+        self._last_sent = [self._last_sent[i] for i in keep]
+        _LOGGER.debug("Removed %s from synchronized animation", light_entity)
+
     async def _animation_loop(self) -> None:
         """Main animation loop - each light shows a different color, all cycle in sync."""
-        num_colors = len(self.colors)
-
-        while self._running:
+        colors_as_lists = self._colors_as_lists
+        template = self._template
+        # Bind per-tick lookups to locals once, outside the loop
+        async_call = self.hass.services.async_call
+        gather = asyncio.gather
+        sleep = asyncio.sleep
+        loop = self.hass.loop
+        next_tick = loop.time()
+        errors = 0
+
+        # Runs until stop() or remove_light() cancels the task
+        while True:
             try:
-                # Apply a different color to each light based on its offset
-                for i, light_entity in enumerate(self.light_entities):
-                    # Each light gets a color at (current_index + its_offset) % num_colors
-                    color_index = (self._current_index + self._light_offsets[i]) % num_colors
-                    color = self.colors[color_index]
-
-                    # Build service call data for this light
-                    service_data = {
-                        ATTR_ENTITY_ID: light_entity,
-                        ATTR_RGB_COLOR: list(color),
-                        ATTR_TRANSITION: self.transition,
-                    }
-
-                    # Add brightness if specified
-                    if self.brightness is not None:
-                        service_data[ATTR_BRIGHTNESS] = int((self.brightness / 100) * 255)
-
-                    # Apply color to this light
-                    await self.hass.services.async_call(
-                        "light",
-                        SERVICE_TURN_ON,
-                        service_data,
-                        blocking=False,
-                    )
-
-                # Move to next color (all lights advance together)
-                self._current_index = (self._current_index + 1) % num_colors
-
-                # Wait before next color change
-                await asyncio.sleep(self.speed)
+                # remove_light() swaps in new per-light lists, so read them once per tick
+                light_entities = self.light_entities
+                last_sent = self._last_sent
+
+                # Group the lights whose color changes this tick by color index
+                # Each light advances one color from its own offset, all in lockstep
+                groups: dict[int, list[int]] = {}
+                for i, color_index in enumerate(map(next, self._index_cycles)):
+                    rgb_color = colors_as_lists[color_index]
+                    if rgb_color == last_sent[i]:
+                        continue
+                    last_sent[i] = rgb_color
+                    groups.setdefault(color_index, []).append(i)
+
+                # One call per color, all submitted together so the lights change simultaneously
+                results = await gather(
+                    *(
+                        async_call(
+                            "light",
+                            SERVICE_TURN_ON,
+                            {
+                                **template,
+                                ATTR_ENTITY_ID: [light_entities[i] for i in indices],
+                                ATTR_RGB_COLOR: colors_as_lists[color_index],
+                            },
+                            blocking=False,
+                        )
+                        for color_index, indices in groups.items()
+                    ),
+                    return_exceptions=True,
+                )
+                failed = False
+                for indices, result in zip(groups.values(), results, strict=True):
+                    if isinstance(result, Exception):
+                        # Resend on the next tick rather than assuming the lights changed
+                        for i in indices:
+                            last_sent[i] = None
+                        if not failed:
+                            failed = True
+                            errors += 1
+                        if _should_log_error(errors):
+                            _LOGGER.error(
+                                "Error in synchronized animation for %s (%d consecutive): %s",
+                                ", ".join(light_entities[i] for i in indices),
+                                errors,
+                                result,
+                            )
+                if not failed:
+                    errors = 0
+
+                # Wait until the next color change is due
+                next_tick = _next_deadline(next_tick, self.speed, loop.time())
+                await sleep(max(0, next_tick - loop.time()))
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                _LOGGER.error("Error in synchronized animation loop: %s", e)
+                errors += 1
+                if _should_log_error(errors):
+                    _LOGGER.error("Error in synchronized animation loop (%d consecutive): %s", errors, e)
                 await asyncio.sleep(1)  # Brief pause before retry
+                next_tick = loop.time()
 
 
 class StaggeredAnimationController:
@@ -270,11 +424,25 @@ class StaggeredAnimationController:
     creating an organic, non-synchronized breathing effect.
     """
 
+    __slots__ = (
+        "_colors_as_lists",
+        "_light_indices",
+        "_running",
+        "_tasks",
+        "_templates",
+        "brightness",
+        "colors",
+        "hass",
+        "light_entities",
+        "speed",
+        "transition",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
         light_entities: list[str],
-        colors: list[RGBColor],
+        colors: Sequence[RGBColor],
         speed: float,
         transition: float = DEFAULT_TRANSITION_TIME,
         brightness: int | None = None,
@@ -305,6 +473,11 @@ class StaggeredAnimationController:
         # Start each light at a different position in the color cycle
         self._light_indices = [(i * num_colors) // num_lights for i in range(num_lights)]
 
+        # Per-light service data that does not change between ticks
+        self._templates = [_service_data_template(light_entity, transition, brightness) for light_entity in light_entities]
+        # rgb_color payloads built once; shared across ticks and never mutated
+        self._colors_as_lists = _rgb_payloads(colors)
+
     @property
     def is_running(self) -> bool:
         """Return True if animation is currently running."""
@@ -337,68 +510,83 @@ class StaggeredAnimationController:
         """Stop all staggered animation loops."""
         self._running = False
 
+        # Cancel every per-light loop first, then wait for them together
         for task in self._tasks:
             task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        await asyncio.gather(*self._tasks, return_exceptions=True)
 
         self._tasks.clear()
         _LOGGER.info("Stopped staggered animation for %d lights", len(self.light_entities))
 
+    async def remove_light(self, light_entity: str) -> None:
+        """Stop animating one light while the other lights keep cycling."""
+        if light_entity not in self.light_entities:
+            return
+
+        # Each loop captured its own index and template at start, so the per-light
+        # lists can be rebuilt without disturbing the remaining tasks
+        index = self.light_entities.index(light_entity)
+        task = self._tasks[index] if index < len(self._tasks) else None
+        keep = [i for i in range(len(self.light_entities)) if i != index]
+        self.light_entities = [self.light_entities[i] for i in keep]
+        self._light_indices = [self._light_indices[i] for i in keep]
+        self._templates = [self._templates[i] for i in keep]
+        if task is not None:
+            self._tasks.remove(task)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        _LOGGER.debug("Removed %s from staggered animation", light_entity)
+
     async def _light_animation_loop(self, light_index: int, light_entity: str) -> None:
         """Animation loop for a single light with random delays."""
-        num_colors = len(self.colors)
-        color_index = self._light_indices[light_index]
-
-        while self._running:
+        # Cycle through the colors starting at this light's position
+        start = self._light_indices[light_index]
+        colors = cycle(self._colors_as_lists[start:] + self._colors_as_lists[:start])
+        template = self._templates[light_index]
+        # Bind per-tick lookups to locals once, outside the loop
+        async_call = self.hass.services.async_call
+        uniform = random.uniform
+        sleep = asyncio.sleep
+        errors = 0
+
+        # Runs until stop() or remove_light() cancels the task
+        while True:
             try:
                 # Random delay before changing color (0 to speed seconds)
-                delay = random.uniform(0, self.speed)
-                await asyncio.sleep(delay)
-
-                if not self._running:
-                    break
-
-                color = self.colors[color_index]
-
-                # Build service call data
-                service_data = {
-                    ATTR_ENTITY_ID: light_entity,
-                    ATTR_RGB_COLOR: list(color),
-                    ATTR_TRANSITION: self.transition,
-                }
-
-                # Add brightness if specified
-                if self.brightness is not None:
-                    service_data[ATTR_BRIGHTNESS] = int((self.brightness / 100) * 255)
+                delay = uniform(0, self.speed)
+                await sleep(delay)
 
                 # Apply color to light
-                await self.hass.services.async_call(
-                    "light",
-                    SERVICE_TURN_ON,
-                    service_data,
-                    blocking=False,
-                )
-
-                # Move to next color
-                color_index = (color_index + 1) % num_colors
+                await async_call("light", SERVICE_TURN_ON, {**template, ATTR_RGB_COLOR: next(colors)}, blocking=False)
+                errors = 0
 
                 # Wait remaining time until next cycle
                 remaining_wait = self.speed - delay
                 if remaining_wait > 0:
-                    await asyncio.sleep(remaining_wait)
+                    await sleep(remaining_wait)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                _LOGGER.error("Error in staggered animation for %s: %s", light_entity, e)
+                errors += 1
+                if _should_log_error(errors):
+                    _LOGGER.error("Error in staggered animation for %s (%d consecutive): %s", light_entity, errors, e)
                 await asyncio.sleep(1)
 
 
+# Any controller the AnimationManager can own
+type AnyAnimationController = AnimationController | SynchronizedAnimationController | StaggeredAnimationController
+
+
 class AnimationManager:
-    """Manages animation controllers (individual, synchronized, and staggered)."""
+    """Manages animation controllers (individual, synchronized, and staggered).
+
+    Controllers keep a reference to the colors they are given rather than copying
+    them, so callers should pass an immutable sequence (e.g. a tuple) that can be
+    shared across lights.
+    """
+
+    __slots__ = ("_controllers", "_staggered_controller", "_sync_controller", "_sync_lights", "hass")
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the animation manager."""
@@ -415,7 +603,7 @@ class AnimationManager:
     async def start_animation(
         self,
         light_entity: str,
-        colors: list[RGBColor],
+        colors: Sequence[RGBColor],
         speed: float,
         transition: float = DEFAULT_TRANSITION_TIME,
         brightness: int | None = None,
@@ -426,7 +614,7 @@ class AnimationManager:
             await self._controllers[light_entity].stop()
 
         # Remove from sync if it was in sync mode
-        self._sync_lights.discard(light_entity)
+        await self._remove_from_group(light_entity)
 
         # Create new controller
         controller = AnimationController(
@@ -443,7 +631,7 @@ class AnimationManager:
     async def start_synchronized_animation(
         self,
         light_entities: list[str],
-        colors: list[RGBColor],
+        colors: Sequence[RGBColor],
         speed: float,
         transition: float = DEFAULT_TRANSITION_TIME,
         brightness: int | None = None,
@@ -475,7 +663,7 @@ class AnimationManager:
     async def start_staggered_animation(
         self,
         light_entities: list[str],
-        colors: list[RGBColor],
+        colors: Sequence[RGBColor],
         speed: float,
         transition: float = DEFAULT_TRANSITION_TIME,
         brightness: int | None = None,
@@ -507,36 +695,48 @@ class AnimationManager:
 
     async def _stop_group_animations(self, light_entities: list[str]) -> None:
         """Stop any existing animations for the given lights."""
-        # Stop individual controllers
-        for light_entity in light_entities:
-            if light_entity in self._controllers:
-                await self._controllers[light_entity].stop()
-                del self._controllers[light_entity]
+        # Stop individual controllers and any group controller concurrently
+        controllers: list[AnyAnimationController] = [
+            self._controllers.pop(light_entity) for light_entity in light_entities if light_entity in self._controllers
+        ]
+        if self._sync_controller:
+            controllers.append(self._sync_controller)
+            self._sync_controller = None
+        if self._staggered_controller:
+            controllers.append(self._staggered_controller)
+            self._staggered_controller = None
+
+        await asyncio.gather(*(controller.stop() for controller in controllers), return_exceptions=True)
+
+        self._sync_lights.clear()
+
+    async def _remove_from_group(self, light_entity: str) -> None:
+        """Take a light out of sync/staggered mode, stopping the group once it is empty."""
+        if light_entity not in self._sync_lights:
+            return
 
-        # Stop existing sync controller if running
+        self._sync_lights.discard(light_entity)
+        if self._sync_lights:
+            # Other grouped lights keep animating without a controller restart
+            if self._sync_controller:
+                await self._sync_controller.remove_light(light_entity)
+            if self._staggered_controller:
+                await self._staggered_controller.remove_light(light_entity)
+            return
+
+        # Last grouped light departed: stop the group controller
         if self._sync_controller:
             await self._sync_controller.stop()
             self._sync_controller = None
-
-        # Stop existing staggered controller if running
         if self._staggered_controller:
             await self._staggered_controller.stop()
             self._staggered_controller = None
 
-        self._sync_lights.clear()
-
     async def stop_animation(self, light_entity: str) -> None:
         """Stop animation for a light entity."""
         # Check if it's in sync/staggered mode
         if light_entity in self._sync_lights:
-            # Stop the entire group controller when any grouped light is stopped
-            if self._sync_controller:
-                await self._sync_controller.stop()
-                self._sync_controller = None
-            if self._staggered_controller:
-                await self._staggered_controller.stop()
-                self._staggered_controller = None
-            self._sync_lights.clear()
+            await self._remove_from_group(light_entity)
             return
 
         # Stop individual controller
@@ -546,22 +746,19 @@ class AnimationManager:
 
     async def stop_all(self) -> None:
         """Stop all running animations."""
-        # Stop sync controller
+        controllers: list[AnyAnimationController] = list(self._controllers.values())
         if self._sync_controller:
-            await self._sync_controller.stop()
-            self._sync_controller = None
-
-        # Stop staggered controller
+            controllers.append(self._sync_controller)
         if self._staggered_controller:
-            await self._staggered_controller.stop()
-            self._staggered_controller = None
+            controllers.append(self._staggered_controller)
 
+        self._controllers.clear()
+        self._sync_controller = None
+        self._staggered_controller = None
         self._sync_lights.clear()
 
-        # Stop individual controllers
-        for controller in list(self._controllers.values()):
-            await controller.stop()
-        self._controllers.clear()
+        # Cancel all animation tasks concurrently
+        await asyncio.gather(*(controller.stop() for controller in controllers), return_exceptions=True)
 
     def is_animating(self, light_entity: str) -> bool:
         """Check if a light entity is currently animating."""
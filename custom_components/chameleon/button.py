@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import weakref
+from typing import Any
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
@@ -14,7 +16,7 @@ from .const import (
     CONF_LIGHT_ENTITY,
     DOMAIN,
 )
-from .helpers import get_chameleon_device_name, get_entity_base_name
+from .helpers import get_chameleon_device_info, get_entity_base_name
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -64,7 +66,10 @@ class ChameleonRefreshButton(ButtonEntity):
         # Generate unique ID and entity ID with chameleon_ prefix
         base_name = get_entity_base_name(hass, light_entities)
         self._base_name = base_name  # Store for use in async_press
+        # Select entity resolved on the first press; weak so it never outlives its platform
+        self._select_entity_ref: weakref.ref[Any] | None = None
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_refresh"
+        self._attr_device_info = get_chameleon_device_info(hass, entry.entry_id, light_entities)
         self.entity_id = f"button.chameleon_{base_name}_refresh_scenes"
 
         _LOGGER.debug(
@@ -73,42 +78,50 @@ class ChameleonRefreshButton(ButtonEntity):
             self._attr_unique_id,
         )
 
-    @property
-    def device_info(self):
-        """Return device info for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": get_chameleon_device_name(self.hass, self._light_entities),
-            "manufacturer": "Chameleon",
-            "model": "Scene Selector",
-        }
+    def _find_select_entity(self) -> Any | None:
+        """Return this entry's select entity, reusing the one found on a previous press."""
+        select_entity_id = f"select.chameleon_{self._base_name}_scene"
+
+        # Fast path: the select belongs to the same entry, so it is reloaded along with
+        # this button and the entity resolved last time stays valid while it is alive
+        if self._select_entity_ref is not None:
+            entity = self._select_entity_ref()
+            if entity is not None and entity.entity_id == select_entity_id:
+                return entity
+            self._select_entity_ref = None
+
+        if not self.hass.states.get(select_entity_id):
+            return None
+
+        # Directly access the entity through the entity registry
+        from homeassistant.helpers import entity_registry as er
+
+        registry = er.async_get(self.hass)
+        if not registry.async_get(select_entity_id):
+            return None
+
+        # Get the actual entity object from the platform
+        entity_component = self.hass.data.get("entity_components", {}).get("select")
+        if not entity_component:
+            return None
+
+        for entity in entity_component.entities:
+            if entity.entity_id == select_entity_id and hasattr(entity, "_async_refresh_options"):
+                self._select_entity_ref = weakref.ref(entity)
+                return entity
+        return None
 
     async def async_press(self) -> None:
         """Handle button press - refresh the scene list."""
         _LOGGER.info("Refresh scenes button pressed for entry: %s", self._entry.entry_id)
 
         # Find the select entity for this entry and trigger a refresh
-        select_entity_id = f"select.chameleon_{self._base_name}_scene"
-        select_entity = self.hass.states.get(select_entity_id)
-
-        if select_entity:
-            # Fire an event that the select entity can listen for
-            # Or directly access the entity through the entity registry
-            from homeassistant.helpers import entity_registry as er
-
-            registry = er.async_get(self.hass)
-            entity_entry = registry.async_get(select_entity_id)
-
-            if entity_entry:
-                # Get the actual entity object from the platform
-                entity_component = self.hass.data.get("entity_components", {}).get("select")
-                if entity_component:
-                    for entity in entity_component.entities:
-                        if entity.entity_id == select_entity_id and hasattr(entity, "_async_refresh_options"):
-                            # Call the refresh method directly
-                            await entity._async_refresh_options()
-                            _LOGGER.info("Scene list refreshed successfully")
-                            return
+        select_entity = self._find_select_entity()
+        if select_entity is not None:
+            # Call the refresh method directly, bypassing the mtime check
+            await select_entity._async_refresh_options(force=True)
+            _LOGGER.info("Scene list refreshed successfully")
+            return
 
         # Fallback: fire an event that can be caught
         self.hass.bus.async_fire(
@@ -2,38 +2,255 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-from pathlib import Path
+import os
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from homeassistant.core import HomeAssistant
 
-from .const import DEFAULT_COLOR_COUNT, DEFAULT_QUALITY
+from .const import (
+    COLOR_CACHE_SAVE_DELAY,
+    COLOR_CACHE_STORAGE_KEY,
+    COLOR_CACHE_STORAGE_VERSION,
+    DEFAULT_COLOR_COUNT,
+    DEFAULT_QUALITY,
+    DOMAIN,
+    PALETTE_CACHE_SIZE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from types import ModuleType
+
+    from PIL import Image
 
 _LOGGER = logging.getLogger(__name__)
 
 # RGB color type
 type RGBColor = tuple[int, int, int]
 
+# Extraction cache key: (kind, image path, mtime_ns, size, color_count, quality)
+type _CacheKey = tuple[str, str, int, int, int, int]
+
+# Longest side of the proxy image colors are extracted from. It shrinks as the
+# quality value rises, giving a 256px proxy at the default quality of 10
+_MAX_SAMPLE_SIZE = 2560
+_MIN_SAMPLE_SIZE = 128
+
+# Bits kept per channel when histogramming for the dominant color, so that
+# near-identical shades (JPEG noise, gradients) are counted together
+_DOMINANT_BITS = 5
+
+
+@functools.cache
+def _pil_image() -> ModuleType:
+    """Import PIL.Image on first use and reuse it for every later extraction.
+
+    Pillow is only needed once an image is actually extracted, so it is not
+    imported when the integration loads.
+    """
+    from PIL import Image
+
+    return Image
+
+
+def _sync_load_image(image_path: str, quality: int) -> Image.Image:
+    """Decode an image to a small RGB proxy sized for the given quality.
+
+    A palette of a few colors does not need every pixel, so work is bounded by
+    the proxy size rather than the image's megapixels. draft() lets JPEGs
+    shrink on load, so the full-size image is never decoded.
+    """
+    Image = _pil_image()
+
+    with Image.open(image_path) as image:
+        # Higher quality values sample fewer pixels, like ColorThief's pixel stride did
+        size = max(_MIN_SAMPLE_SIZE, _MAX_SAMPLE_SIZE // max(quality, 1))
+        image.draft("RGB", (size, size))
+        rgb = image.convert("RGB")
+    rgb.thumbnail((size, size), Image.Resampling.BILINEAR)
+    return rgb
+
 
 def _sync_extract_dominant_color(image_path: str, quality: int) -> RGBColor | None:
     """Synchronous color extraction - runs in executor."""
-    from colorthief import ColorThief
-
-    color_thief = ColorThief(image_path)
-    return color_thief.get_color(quality=quality)
+    return _dominant_color(_sync_load_image(image_path, quality))
 
 
 def _sync_extract_palette(image_path: str, color_count: int, quality: int) -> list[RGBColor]:
     """Synchronous palette extraction - runs in executor."""
-    from colorthief import ColorThief
+    return _palette(_sync_load_image(image_path, quality), color_count)
+
+
+def _sync_extract_colors(image_path: str, color_count: int, quality: int) -> tuple[RGBColor | None, list[RGBColor]]:
+    """Synchronous dominant color and palette extraction from one decode - runs in executor."""
+    image = _sync_load_image(image_path, quality)
+    return _dominant_color(image), _palette(image, color_count)
+
+
+def _dominant_color(image: Image.Image) -> RGBColor | None:
+    """Return the dominant color of an RGB image.
+
+    Pixels are binned into a coarse RGB histogram with np.bincount; the
+    dominant color is the mean of the pixels in the fullest bin.
+    """
+    pixels = np.asarray(image, dtype=np.uint8).reshape(-1, 3)
+    if not len(pixels):
+        return None
+
+    shift = 8 - _DOMINANT_BITS
+    binned = (pixels >> shift).astype(np.uint32)
+    packed = (binned[:, 0] << (2 * _DOMINANT_BITS)) | (binned[:, 1] << _DOMINANT_BITS) | binned[:, 2]
+    fullest = np.bincount(packed, minlength=1 << (3 * _DOMINANT_BITS)).argmax()
+
+    r, g, b = pixels[packed == fullest].mean(axis=0).round().astype(int).tolist()
+    return (r, g, b)
+
+
+def _palette(image: Image.Image, color_count: int) -> list[RGBColor]:
+    """Return a palette of an RGB image.
+
+    Median-cut quantization (in Pillow's C core) returns the colors most
+    common first.
+    """
+    quantized = image.quantize(colors=color_count, method=_pil_image().Quantize.MEDIANCUT)
+    palette = quantized.getpalette() or []
+    counts = sorted(quantized.getcolors(color_count) or [], reverse=True)
+    return [tuple(palette[index * 3 : index * 3 + 3]) for _, index in counts]
+
+
+async def _async_cache_key(
+    hass: HomeAssistant,
+    kind: str,
+    image_path: str,
+    color_count: int,
+    quality: int,
+) -> _CacheKey:
+    """Build an extraction cache key; mtime and size make edited images miss the cache."""
+    stat = await hass.async_add_executor_job(os.stat, image_path)
+    return (kind, image_path, stat.st_mtime_ns, stat.st_size, color_count, quality)
+
+
+def _get_cache(hass: HomeAssistant) -> OrderedDict[_CacheKey, list[RGBColor]]:
+    """Return the shared LRU cache of extraction results."""
+    return hass.data.setdefault(DOMAIN, {}).setdefault("palette_cache", OrderedDict())
+
+
+def _cache_lookup(hass: HomeAssistant, key: _CacheKey) -> list[RGBColor] | None:
+    """Return a copy of a cached extraction result and mark it recently used."""
+    cache = _get_cache(hass)
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    cache.move_to_end(key)
+    return list(cached)
+
+
+def _cache_store(hass: HomeAssistant, key: _CacheKey, colors: list[RGBColor]) -> None:
+    """Store an extraction result, evicting the least recently used entry."""
+    cache = _get_cache(hass)
+    cache[key] = list(colors)
+    if len(cache) > PALETTE_CACHE_SIZE:
+        cache.popitem(last=False)
+
+    # Persist in the background so restarts do not re-extract unchanged images
+    store = hass.data[DOMAIN].get("palette_store")
+    if store is not None:
+        store.async_delay_save(lambda: _serialize_cache(cache), COLOR_CACHE_SAVE_DELAY)
+
+
+def _serialize_cache(cache: OrderedDict[_CacheKey, list[RGBColor]]) -> list[list[Any]]:
+    """Return the cache as JSON-friendly [key, colors] pairs, least recently used first."""
+    return [[list(key), [list(color) for color in colors]] for key, colors in cache.items()]
+
+
+async def async_load_color_cache(hass: HomeAssistant) -> None:
+    """Seed the extraction cache from disk and persist it from then on.
+
+    Only the first call loads anything, until async_unload_color_cache drops
+    the cache when the last entry unloads. Entries for images that have since
+    changed never match again (their mtime and size are part of the key) and
+    age out of the LRU.
+
+    Args:
+        hass: Home Assistant instance
+    """
+    from homeassistant.helpers.storage import Store
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "palette_store" in domain_data:
+        return
+
+    store: Store[list[list[Any]]] = Store(hass, COLOR_CACHE_STORAGE_VERSION, COLOR_CACHE_STORAGE_KEY)
+    domain_data["palette_store"] = store
+
+    try:
+        stored = await store.async_load()
+    except Exception as e:
+        _LOGGER.warning("Failed to load stored color cache: %s", e)
+        return
+
+    cache = _get_cache(hass)
+    for key, colors in stored or []:
+        cache.setdefault(tuple(key), [tuple(color) for color in colors])
+    while len(cache) > PALETTE_CACHE_SIZE:
+        cache.popitem(last=False)
+    _LOGGER.debug("Loaded %d stored color extraction results", len(cache))
+
+
+async def async_unload_color_cache(hass: HomeAssistant) -> None:
+    """Write the extraction cache to disk and drop it from memory.
+
+    The immediate save replaces any pending delayed save, so a later
+    async_load_color_cache (e.g. when an entry is added again) restores every
+    result.
+
+    Args:
+        hass: Home Assistant instance
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+    domain_data.pop("extraction_inflight", None)
+    cache = domain_data.pop("palette_cache", None)
+    store = domain_data.pop("palette_store", None)
+    if store is not None and cache is not None:
+        await store.async_save(_serialize_cache(cache))
+
+
+async def _async_run_shared[T](hass: HomeAssistant, key: _CacheKey, job: Callable[..., T], *args: Any) -> T:
+    """Run an extraction job in the executor, sharing it with concurrent callers.
 
-    color_thief = ColorThief(image_path)
-    return color_thief.get_palette(color_count=color_count, quality=quality)
+    Lights of one entry (or several entries) selecting the same image at the
+    same moment all miss the cache; they now await one executor job instead of
+    each decoding the image.
+
+    Args:
+        hass: Home Assistant instance (needed for executor)
+        key: Cache key identifying the extraction
+        job: Synchronous extraction function
+        *args: Arguments for the job
+    """
+    inflight: dict[_CacheKey, asyncio.Future[Any]] = hass.data.setdefault(DOMAIN, {}).setdefault("extraction_inflight", {})
+    pending = inflight.get(key)
+    if pending is not None:
+        _LOGGER.debug("Waiting for in-flight extraction of %s", key[1])
+        # Shielded so a cancelled caller does not cancel the job for the others
+        return await asyncio.shield(pending)
+
+    future = hass.async_add_executor_job(job, *args)
+    inflight[key] = future
+    try:
+        return await asyncio.shield(future)
+    finally:
+        inflight.pop(key, None)
 
 
 async def extract_dominant_color(
     hass: HomeAssistant,
-    image_path: Path,
+    image_path: str | os.PathLike[str],
     quality: int = DEFAULT_QUALITY,
 ) -> RGBColor | None:
     """
@@ -48,13 +265,26 @@ async def extract_dominant_color(
         RGB tuple (r, g, b) or None if extraction fails
     """
     try:
+        # Convert once; the string is both the cache key path and the executor argument
+        path = os.fspath(image_path)
+        cache_key = await _async_cache_key(hass, "dominant", path, 1, quality)
+        cached = _cache_lookup(hass, cache_key)
+        if cached is not None:
+            _LOGGER.debug("Using cached dominant color for %s", image_path)
+            return cached[0]
+
         _LOGGER.debug("Extracting dominant color from %s", image_path)
-        color = await hass.async_add_executor_job(
+        color = await _async_run_shared(
+            hass,
+            cache_key,
             _sync_extract_dominant_color,
-            str(image_path),
+            path,
             quality,
         )
         _LOGGER.debug("Extracted dominant color: %s", color)
+
+        if color:
+            _cache_store(hass, cache_key, [color])
         return color
     except Exception as e:
         _LOGGER.error("Failed to extract dominant color from %s: %s", image_path, e)
@@ -63,7 +293,7 @@ async def extract_dominant_color(
 
 async def extract_color_palette(
     hass: HomeAssistant,
-    image_path: Path,
+    image_path: str | os.PathLike[str],
     color_count: int = DEFAULT_COLOR_COUNT,
     quality: int = DEFAULT_QUALITY,
 ) -> list[RGBColor]:
@@ -80,22 +310,89 @@ async def extract_color_palette(
         List of RGB tuples, or empty list if extraction fails
     """
     try:
+        # Palettes are cached per file version, so repeat scene applies skip extraction
+        path = os.fspath(image_path)
+        cache_key = await _async_cache_key(hass, "palette", path, color_count, quality)
+        cached = _cache_lookup(hass, cache_key)
+        if cached is not None:
+            _LOGGER.debug("Using cached palette for %s", image_path)
+            return cached
+
         _LOGGER.debug("Extracting %d colors from %s", color_count, image_path)
-        colors = await hass.async_add_executor_job(
+        colors = await _async_run_shared(
+            hass,
+            cache_key,
             _sync_extract_palette,
-            str(image_path),
+            path,
             color_count,
             quality,
         )
         _LOGGER.debug("Extracted %d colors: %s", len(colors), colors)
-        return colors
+
+        if colors:
+            _cache_store(hass, cache_key, colors)
+        # Concurrent callers share the executor result; give each its own list
+        return list(colors)
     except Exception as e:
         _LOGGER.error("Failed to extract color palette from %s: %s", image_path, e)
         return []
 
 
+async def extract_colors(
+    hass: HomeAssistant,
+    image_path: str | os.PathLike[str],
+    color_count: int = DEFAULT_COLOR_COUNT,
+    quality: int = DEFAULT_QUALITY,
+) -> tuple[RGBColor | None, list[RGBColor]]:
+    """
+    Extract both the dominant color and a palette from an image.
+
+    The image is decoded once for both results, and each is cached exactly
+    as extract_dominant_color and extract_color_palette cache it, so later
+    calls to either of those hit the cache.
+
+    Args:
+        hass: Home Assistant instance (needed for executor)
+        image_path: Path to the image file
+        color_count: Number of palette colors to extract
+        quality: Color extraction quality (1=highest, 10=fastest)
+
+    Returns:
+        Tuple of (dominant color or None, palette list), each empty on failure
+    """
+    try:
+        path = os.fspath(image_path)
+        palette_key = await _async_cache_key(hass, "palette", path, color_count, quality)
+        # Same file version, so the dominant color key reuses the stat
+        dominant_key: _CacheKey = ("dominant", *palette_key[1:4], 1, quality)
+        cached_dominant = _cache_lookup(hass, dominant_key)
+        cached_palette = _cache_lookup(hass, palette_key)
+        if cached_dominant is not None and cached_palette is not None:
+            _LOGGER.debug("Using cached colors for %s", image_path)
+            return cached_dominant[0], cached_palette
+
+        _LOGGER.debug("Extracting dominant color and %d colors from %s", color_count, image_path)
+        color, colors = await _async_run_shared(
+            hass,
+            ("colors", *palette_key[1:]),
+            _sync_extract_colors,
+            path,
+            color_count,
+            quality,
+        )
+
+        if color:
+            _cache_store(hass, dominant_key, [color])
+        if colors:
+            _cache_store(hass, palette_key, colors)
+        return color, list(colors)
+    except Exception as e:
+        _LOGGER.error("Failed to extract colors from %s: %s", image_path, e)
+        return None, []
+
+
 def generate_gradient_path(
-    colors: list[RGBColor],
+    colors: Sequence[RGBColor] | np.ndarray,
     steps_between: int = 10,
 ) -> list[RGBColor]:
     """
@@ -105,30 +402,40 @@ def generate_gradient_path(
     resulting in a smooth color progression suitable for animation.
 
     Args:
-        colors: List of RGB colors from palette extraction
+        colors: RGB colors from palette extraction, as tuples or an (N, 3) array
         steps_between: Number of intermediate steps between each color pair
 
     Returns:
         List of RGB tuples representing the full gradient path
     """
-    if len(colors) < 2:
-        return colors
+    return list(map(tuple, generate_gradient_array(colors, steps_between).tolist()))
 
-    gradient: list[RGBColor] = []
 
-    for i in range(len(colors)):
-        current_color = colors[i]
-        next_color = colors[(i + 1) % len(colors)]  # Loop back to first color
+def generate_gradient_array(
+    colors: Sequence[RGBColor] | np.ndarray,
+    steps_between: int = 10,
+) -> np.ndarray:
+    """
+    Generate the gradient path of generate_gradient_path as a packed array.
 
-        # Add intermediate steps
-        for step in range(steps_between):
-            t = step / steps_between
-            r = int(current_color[0] + (next_color[0] - current_color[0]) * t)
-            g = int(current_color[1] + (next_color[1] - current_color[1]) * t)
-            b = int(current_color[2] + (next_color[2] - current_color[2]) * t)
-            gradient.append((r, g, b))
+    Args:
+        colors: RGB colors from palette extraction, as tuples or an (N, 3) array
+        steps_between: Number of intermediate steps between each color pair
+
+    Returns:
+        Array of shape (M, 3) and dtype uint8 holding the gradient path
+    """
+    current = np.asarray(colors, dtype=np.float64).reshape(-1, 3)
+    if len(current) < 2:
+        return current.astype(np.uint8)
 
-    return gradient
+    # Interpolate every segment at once: (num_colors, steps_between, 3)
+    following = np.roll(current, -1, axis=0)  # Loop back to first color
+    t = np.arange(steps_between, dtype=np.float64) / steps_between
+    gradient = current[:, None, :] + (following - current)[:, None, :] * t[None, :, None]
+
+    # Truncate like int() and flatten into a single path
+    return gradient.reshape(-1, 3).astype(np.uint8)
 
 
 def rgb_to_hs(rgb: RGBColor) -> tuple[float, float]:
@@ -145,25 +452,44 @@ def rgb_to_hs(rgb: RGBColor) -> tuple[float, float]:
     Returns:
         Tuple of (hue, saturation)
     """
-    r, g, b = rgb[0] / 255.0, rgb[1] / 255.0, rgb[2] / 255.0
-    max_c = max(r, g, b)
-    min_c = min(r, g, b)
+    hue, saturation = rgb_to_hs_batch([rgb])[0].tolist()
+    return (hue, saturation)
+
+
+def rgb_to_hs_batch(colors: Sequence[RGBColor] | np.ndarray) -> np.ndarray:
+    """
+    Convert a palette of RGB colors to Hue/Saturation in one vectorized pass.
+
+    The hue formula is picked per row from the channel holding the maximum,
+    so there is no per-color branching. Use ``.tolist()`` on the result for
+    per-color access.
+
+    Args:
+        colors: RGB tuples or an (N, 3) array (0-255 for each channel)
+
+    Returns:
+        Array of shape (N, 2) holding (hue, saturation) rows
+    """
+    rgb = np.asarray(colors, dtype=np.float64).reshape(-1, 3) / 255.0
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    max_c = rgb.max(axis=1)
+    min_c = rgb.min(axis=1)
     diff = max_c - min_c
+    # On ties the first channel wins, matching the red > green > blue precedence
+    max_channel = rgb.argmax(axis=1)
+
+    # Grays have no hue; divide by 1 there to avoid warnings, the result is masked below
+    safe_diff = np.where(diff == 0, 1.0, diff)
+    hue = (
+        np.select(
+            [diff == 0, max_channel == 0, max_channel == 1],
+            [0.0, 60 * ((g - b) / safe_diff) + 360, 60 * ((b - r) / safe_diff) + 120],
+            default=60 * ((r - g) / safe_diff) + 240,
+        )
+        % 360
+    )
 
-    # Calculate hue
-    if diff == 0:
-        hue = 0
-    elif max_c == r:
-        hue = (60 * ((g - b) / diff) + 360) % 360
-    elif max_c == g:
-        hue = (60 * ((b - r) / diff) + 120) % 360
-    else:
-        hue = (60 * ((r - g) / diff) + 240) % 360
-
-    # Calculate saturation
-    if max_c == 0:
-        saturation = 0
-    else:
-        saturation = (diff / max_c) * 100
+    safe_max = np.where(max_c == 0, 1.0, max_c)
+    saturation = np.where(max_c == 0, 0.0, (diff / safe_max) * 100)
 
-    return (hue, saturation)
+    return np.stack((hue, saturation), axis=1)
@@ -19,19 +19,44 @@ from .const import (
     CONF_ANIMATION_ENABLED,
     CONF_ANIMATION_SPEED,
     CONF_LIGHT_ENTITIES,
+    CONFIG_ENTRY_MINOR_VERSION,
+    CONFIG_ENTRY_VERSION,
     DEFAULT_ANIMATION_ENABLED,
     DEFAULT_ANIMATION_SPEED,
     DOMAIN,
     MAX_ANIMATION_SPEED,
     MIN_ANIMATION_SPEED,
 )
-from .helpers import get_entry_title
+from .helpers import get_entry_title, get_entry_unique_id
+
+# Built once at import; the user step form is the same on every render
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_LIGHT_ENTITIES): EntitySelector(
+            EntitySelectorConfig(
+                domain="light",
+                multiple=True,
+            )
+        ),
+        vol.Required(CONF_ANIMATION_ENABLED, default=DEFAULT_ANIMATION_ENABLED): BooleanSelector(),
+        vol.Required(CONF_ANIMATION_SPEED, default=DEFAULT_ANIMATION_SPEED): NumberSelector(
+            NumberSelectorConfig(
+                min=MIN_ANIMATION_SPEED,
+                max=MAX_ANIMATION_SPEED,
+                step=0.1,
+                unit_of_measurement="seconds",
+                mode=NumberSelectorMode.SLIDER,
+            )
+        ),
+    }
+)
 
 
 class ChameleonConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Chameleon."""
 
-    VERSION = 2  # Bumped for multi-light support
+    VERSION = CONFIG_ENTRY_VERSION
+    MINOR_VERSION = CONFIG_ENTRY_MINOR_VERSION
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> ConfigFlowResult:
         """Handle the initial step."""
@@ -41,8 +66,7 @@ class ChameleonConfigFlow(ConfigFlow, domain=DOMAIN):
             light_entities: list[str] = user_input[CONF_LIGHT_ENTITIES]
 
             # Create a unique ID from sorted light entities
-            unique_id = "_".join(sorted(light_entities))
-            await self.async_set_unique_id(unique_id)
+            await self.async_set_unique_id(get_entry_unique_id(light_entities))
             self._abort_if_unique_id_configured()
 
             # Create the config entry with area-aware naming
@@ -52,30 +76,8 @@ class ChameleonConfigFlow(ConfigFlow, domain=DOMAIN):
                 data=user_input,
             )
 
-        # Show the form
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_LIGHT_ENTITIES): EntitySelector(
-                    EntitySelectorConfig(
-                        domain="light",
-                        multiple=True,
-                    )
-                ),
-                vol.Required(CONF_ANIMATION_ENABLED, default=DEFAULT_ANIMATION_ENABLED): BooleanSelector(),
-                vol.Required(CONF_ANIMATION_SPEED, default=DEFAULT_ANIMATION_SPEED): NumberSelector(
-                    NumberSelectorConfig(
-                        min=MIN_ANIMATION_SPEED,
-                        max=MAX_ANIMATION_SPEED,
-                        step=0.1,
-                        unit_of_measurement="seconds",
-                        mode=NumberSelectorMode.SLIDER,
-                    )
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
@@ -23,6 +23,10 @@ CONF_LIGHT_ENTITIES: Final = "light_entities"  # New: list of light entities
 CONF_ANIMATION_ENABLED: Final = "animation_enabled"
 CONF_ANIMATION_SPEED: Final = "animation_speed"
 
+# Config entry versions
+CONFIG_ENTRY_VERSION: Final = 2  # Bumped for multi-light support
+CONFIG_ENTRY_MINOR_VERSION: Final = 2  # Unique ID is a digest of the lights rather than their joined IDs
+
 # Platforms
 PLATFORMS: Final = ["select", "number", "switch", "button"]
 
@@ -46,6 +50,12 @@ SCENE_RANDOM: Final = "Random"  # Pick a random scene
 # Color extraction
 DEFAULT_COLOR_COUNT: Final = 8  # Number of colors to extract for palette
 DEFAULT_QUALITY: Final = 10  # Color extraction quality (1 = highest, 10 = fastest)
+PALETTE_CACHE_SIZE: Final = 128  # Extraction results kept in memory (LRU)
+GRADIENT_CACHE_SIZE: Final = 8  # Animation gradients kept per scene select (LRU)
+PREFETCH_CONCURRENCY: Final = 2  # New scene images decoded at once per scene select
+COLOR_CACHE_STORAGE_KEY: Final = f"{DOMAIN}.colors"  # .storage file persisting extraction results
+COLOR_CACHE_STORAGE_VERSION: Final = 1
+COLOR_CACHE_SAVE_DELAY: Final = 30  # Seconds to batch cache writes before saving
 
 # Animation
 MIN_ANIMATION_SPEED: Final = 0.1  # Minimum seconds per color change
@@ -60,6 +70,8 @@ CONF_SYNC_ANIMATION: Final = "sync_animation"
 DEFAULT_BRIGHTNESS: Final = 100  # Default brightness percentage
 MIN_BRIGHTNESS: Final = 1
 MAX_BRIGHTNESS: Final = 100
+BRIGHTNESS_DEBOUNCE_DELAY: Final = 0.1  # Seconds a slider value must settle before lights update
 
 # Options caching
 OPTIONS_CACHE_INTERVAL: Final = timedelta(seconds=30)  # Refresh image list every 30s
+OPTIONS_CACHE_MAX_INTERVAL: Final = timedelta(hours=1)  # Longest refresh backoff while the list is unchanged
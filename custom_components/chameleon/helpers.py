@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import logging
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from .const import DOMAIN
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, HomeAssistant
     from homeassistant.helpers import device_registry as dr
     from homeassistant.helpers import entity_registry as er
 
 _LOGGER = logging.getLogger(__name__)
 
+# Patterns used by slugify, compiled once at import
+_SEPARATOR_RE = re.compile(r"[\s\-]+")
+_INVALID_CHAR_RE = re.compile(r"[^a-z0-9_]")
+_UNDERSCORES_RE = re.compile(r"_+")
+_SLUG_RE = re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*")
+
 
 def slugify(text: str) -> str:
     """Convert text to a slug suitable for entity IDs.
@@ -25,12 +35,15 @@ def slugify(text: str) -> str:
     """
     # Convert to lowercase
     text = text.lower()
+    # Already a slug (e.g. a single-word area name) - nothing to replace
+    if _SLUG_RE.fullmatch(text):
+        return text
     # Replace spaces and hyphens with underscores
-    text = re.sub(r"[\s\-]+", "_", text)
+    text = _SEPARATOR_RE.sub("_", text)
     # Remove any characters that aren't alphanumeric or underscores
-    text = re.sub(r"[^a-z0-9_]", "", text)
+    text = _INVALID_CHAR_RE.sub("", text)
     # Remove consecutive underscores
-    text = re.sub(r"_+", "_", text)
+    text = _UNDERSCORES_RE.sub("_", text)
     # Strip leading/trailing underscores
     return text.strip("_")
 
@@ -50,6 +63,96 @@ def get_chameleon_device_name(hass: HomeAssistant, light_entities: list[str]) ->
     Returns:
         A friendly device name like "Chameleon Dining" or "Chameleon Living Room Light"
     """
+    # Same area-or-first-light name as the entry title, with the integration prefix
+    return f"Chameleon {get_entry_title(hass, light_entities)}"
+
+
+def get_chameleon_device_info(hass: HomeAssistant, entry_id: str, light_entities: list[str]) -> dict[str, Any]:
+    """Build the device info shared by all of a config entry's entities.
+
+    The name is resolved once when an entity is created, which is also the
+    only time Home Assistant reads device info for the device registry.
+
+    Args:
+        hass: Home Assistant instance
+        entry_id: The config entry ID the device belongs to
+        light_entities: List of light entity IDs
+
+    Returns:
+        Device info dict for the entity's _attr_device_info
+    """
+    return {
+        "identifiers": {(DOMAIN, entry_id)},
+        "name": get_chameleon_device_name(hass, light_entities),
+        "manufacturer": "Chameleon",
+        "model": "Scene Selector",
+    }
+
+
+def async_setup_area_name_cache(hass: HomeAssistant) -> None:
+    """Start caching common-area lookups until the registries change.
+
+    Every Chameleon platform resolves the same names for its entry during
+    setup; with the cache, only the first one walks the registries. Entity,
+    device and area registry updates clear it. Without this call (e.g. in the
+    config flow) lookups are not cached.
+
+    Args:
+        hass: Home Assistant instance
+    """
+    from homeassistant.core import callback
+    from homeassistant.helpers import area_registry as ar
+    from homeassistant.helpers import device_registry as dr
+    from homeassistant.helpers import entity_registry as er
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "area_name_cache" in domain_data:
+        return
+
+    cache: dict[tuple[str, ...], str | None] = {}
+
+    @callback
+    def _async_invalidate(_event: Event) -> None:
+        cache.clear()
+
+    domain_data["area_name_cache"] = cache
+    domain_data["area_name_cache_unsubs"] = [
+        hass.bus.async_listen(event_type, _async_invalidate)
+        for event_type in (
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            ar.EVENT_AREA_REGISTRY_UPDATED,
+        )
+    ]
+
+
+def async_unload_area_name_cache(hass: HomeAssistant) -> None:
+    """Drop the common-area cache and stop listening for registry updates.
+
+    Args:
+        hass: Home Assistant instance
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+    domain_data.pop("area_name_cache", None)
+    for unsub in domain_data.pop("area_name_cache_unsubs", []):
+        unsub()
+
+
+def _common_area_name(hass: HomeAssistant, light_entities: list[str]) -> str | None:
+    """Return the name of the area all lights share, if there is exactly one.
+
+    Args:
+        hass: Home Assistant instance
+        light_entities: List of light entity IDs
+
+    Returns:
+        The shared area's name, or None if the lights span zero or several areas
+    """
+    cache: dict[tuple[str, ...], str | None] | None = hass.data.get(DOMAIN, {}).get("area_name_cache")
+    key = tuple(light_entities)
+    if cache is not None and key in cache:
+        return cache[key]
+
     # Import here to avoid circular imports
     from homeassistant.helpers import area_registry as ar
     from homeassistant.helpers import device_registry as dr
@@ -57,36 +160,20 @@ def get_chameleon_device_name(hass: HomeAssistant, light_entities: list[str]) ->
 
     entity_registry = er.async_get(hass)
     device_registry = dr.async_get(hass)
-    area_registry = ar.async_get(hass)
 
-    # Try to find a common area for all lights
-    area_ids: set[str | None] = set()
+    # Try to find a common area for all lights, ignoring lights without one
+    area_ids = {_get_entity_area_id(entity_id, entity_registry, device_registry) for entity_id in light_entities}
+    area_ids.discard(None)
 
-    for entity_id in light_entities:
-        area_id = _get_entity_area_id(entity_id, entity_registry, device_registry)
-        area_ids.add(area_id)
-
-    # Filter out None values
-    valid_area_ids = {a for a in area_ids if a is not None}
-
-    # If all lights share exactly one area, use that area name
-    if len(valid_area_ids) == 1:
-        area_id = valid_area_ids.pop()
-        area = area_registry.async_get_area(area_id)
+    area_name = None
+    if len(area_ids) == 1:
+        area = ar.async_get(hass).async_get_area(area_ids.pop())
         if area:
-            _LOGGER.debug(
-                "All lights share area '%s', using for device name",
-                area.name,
-            )
-            return f"Chameleon {area.name}"
+            area_name = area.name
 
-    # Otherwise, use the first light's friendly name
-    first_light_name = _get_light_friendly_name(hass, light_entities[0])
-    _LOGGER.debug(
-        "No common area found, using first light name: %s",
-        first_light_name,
-    )
-    return f"Chameleon {first_light_name}"
+    if cache is not None:
+        cache[key] = area_name
+    return area_name
 
 
 def _get_entity_area_id(
@@ -132,17 +219,30 @@ def _get_light_friendly_name(hass: HomeAssistant, entity_id: str) -> str:
         Friendly name from state attributes, or formatted entity ID as fallback
     """
     state = hass.states.get(entity_id)
-    if state and state.attributes.get("friendly_name"):
-        return state.attributes["friendly_name"]
+    if state and (friendly_name := state.attributes.get("friendly_name")):
+        return friendly_name
 
     # Fall back to entity_id without domain, formatted nicely
+    return _format_entity_id(entity_id)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_entity_id(entity_id: str) -> str:
+    """Format an entity ID as a title, e.g. "light.dining_room" -> "Dining Room".
+
+    Args:
+        entity_id: The entity ID to format
+
+    Returns:
+        The object ID with underscores replaced by spaces, in title case
+    """
     return entity_id.split(".")[-1].replace("_", " ").title()
 
 
 def get_entry_title(hass: HomeAssistant, light_entities: list[str]) -> str:
     """Generate a config entry title based on area or light names.
 
-    This is similar to get_chameleon_device_name but without the "Chameleon " prefix.
+    get_chameleon_device_name uses the same name with a "Chameleon " prefix.
     Used for the config entry title displayed in the integrations page.
 
     Args:
@@ -152,34 +252,9 @@ def get_entry_title(hass: HomeAssistant, light_entities: list[str]) -> str:
     Returns:
         A friendly title like "Dining Room" or "Living Room Light"
     """
-    # Import here to avoid circular imports
-    from homeassistant.helpers import area_registry as ar
-    from homeassistant.helpers import device_registry as dr
-    from homeassistant.helpers import entity_registry as er
-
-    entity_registry = er.async_get(hass)
-    device_registry = dr.async_get(hass)
-    area_registry = ar.async_get(hass)
-
-    # Try to find a common area for all lights
-    area_ids: set[str | None] = set()
-
-    for entity_id in light_entities:
-        area_id = _get_entity_area_id(entity_id, entity_registry, device_registry)
-        area_ids.add(area_id)
-
-    # Filter out None values
-    valid_area_ids = {a for a in area_ids if a is not None}
-
-    # If all lights share exactly one area, use that area name
-    if len(valid_area_ids) == 1:
-        area_id = valid_area_ids.pop()
-        area = area_registry.async_get_area(area_id)
-        if area:
-            return area.name
-
-    # Otherwise, use the first light's friendly name
-    return _get_light_friendly_name(hass, light_entities[0])
+    # If all lights share exactly one area, use that area name,
+    # otherwise the first light's friendly name
+    return _common_area_name(hass, light_entities) or _get_light_friendly_name(hass, light_entities[0])
 
 
 def get_entity_base_name(hass: HomeAssistant, light_entities: list[str]) -> str:
@@ -200,3 +275,18 @@ def get_entity_base_name(hass: HomeAssistant, light_entities: list[str]) -> str:
     friendly_name = get_entry_title(hass, light_entities)
     # Convert to slug
     return slugify(friendly_name)
+
+
+def get_entry_unique_id(light_entities: list[str]) -> str:
+    """Generate a config entry unique ID for a set of lights.
+
+    The ID is a short digest of the sorted entity IDs, so it does not depend on
+    selection order and stays a fixed length however many lights are chosen.
+
+    Args:
+        light_entities: List of light entity IDs
+
+    Returns:
+        A 16-character hex string
+    """
+    return hashlib.blake2b("_".join(sorted(light_entities)).encode(), digest_size=8).hexdigest()
@@ -9,10 +9,11 @@ and services. It handles:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
@@ -33,10 +34,18 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 
 from .color_extractor import RGBColor
-from .const import DEFAULT_TRANSITION_TIME
+from .const import DEFAULT_TRANSITION_TIME, DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from homeassistant.core import State
 
 _LOGGER = logging.getLogger(__name__)
 
+# States in which a light cannot take a color
+_UNAVAILABLE_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN})
+
 
 class LightError(Enum):
     """Types of light errors."""
@@ -47,7 +56,7 @@ class LightError(Enum):
     SERVICE_CALL_FAILED = "service_call_failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class LightResult:
     """Result of applying color to a light."""
 
@@ -58,37 +67,52 @@ class LightResult:
     error_message: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplyColorsResult:
-    """Result of applying colors to multiple lights."""
+    """Result of applying colors to multiple lights.
+
+    Success and failure counts are kept up to date as results are added, so
+    the summary properties do not rescan the results. Add results with add()
+    or extend() rather than mutating the results list directly.
+    """
 
     results: list[LightResult] = field(default_factory=list)
+    succeeded_count: int = field(init=False, default=0)
+    failed_count: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        """Count the results passed to the constructor."""
+        self.succeeded_count = sum(r.success for r in self.results)
+        self.failed_count = len(self.results) - self.succeeded_count
+
+    def add(self, result: LightResult) -> None:
+        """Add a light's result and update the counts."""
+        self.results.append(result)
+        if result.success:
+            self.succeeded_count += 1
+        else:
+            self.failed_count += 1
+
+    def extend(self, results: Iterable[LightResult]) -> None:
+        """Add several lights' results and update the counts."""
+        for result in results:
+            self.add(result)
 
     @property
     def all_succeeded(self) -> bool:
         """Return True if all lights succeeded."""
-        return all(r.success for r in self.results)
+        return self.failed_count == 0
 
     @property
     def all_failed(self) -> bool:
         """Return True if all lights failed."""
-        return all(not r.success for r in self.results)
+        return self.succeeded_count == 0
 
     @property
     def partial_failure(self) -> bool:
         """Return True if some lights failed but not all."""
         return not self.all_succeeded and not self.all_failed
 
-    @property
-    def succeeded_count(self) -> int:
-        """Return count of successful applications."""
-        return sum(1 for r in self.results if r.success)
-
-    @property
-    def failed_count(self) -> int:
-        """Return count of failed applications."""
-        return sum(1 for r in self.results if not r.success)
-
     @property
     def applied_colors(self) -> dict[str, RGBColor]:
         """Return dict of successfully applied colors."""
@@ -104,13 +128,15 @@ class LightController:
     """Controller for applying colors to lights with proper error handling."""
 
     # Color modes that support RGB
-    RGB_COLOR_MODES: ClassVar[set[ColorMode]] = {
-        ColorMode.RGB,
-        ColorMode.RGBW,
-        ColorMode.RGBWW,
-        ColorMode.HS,
-        ColorMode.XY,
-    }
+    RGB_COLOR_MODES: ClassVar[frozenset[ColorMode]] = frozenset(
+        {
+            ColorMode.RGB,
+            ColorMode.RGBW,
+            ColorMode.RGBWW,
+            ColorMode.HS,
+            ColorMode.XY,
+        }
+    )
 
     def __init__(self, hass: HomeAssistant, transition_time: float = DEFAULT_TRANSITION_TIME) -> None:
         """Initialize the light controller.
@@ -131,8 +157,31 @@ class LightController:
         Returns:
             Tuple of (is_available, error_type, error_message)
         """
-        state = self.hass.states.get(entity_id)
+        return self._check_state(entity_id, self.hass.states.get(entity_id))
+
+    def check_lights_availability(self, entity_ids: Iterable[str]) -> list[tuple[bool, LightError | None, str | None]]:
+        """Check several light entities in one pass.
+
+        Args:
+            entity_ids: The light entity IDs to check
+
+        Returns:
+            A (is_available, error_type, error_message) tuple per entity, in order
+        """
+        get_state = self.hass.states.get
+        check_state = self._check_state
+        return [check_state(entity_id, get_state(entity_id)) for entity_id in entity_ids]
+
+    def _check_state(self, entity_id: str, state: State | None) -> tuple[bool, LightError | None, str | None]:
+        """Classify a light's current state for check_light_availability.
 
+        Args:
+            entity_id: The light entity ID
+            state: The entity's current state, or None if it does not exist
+
+        Returns:
+            Tuple of (is_available, error_type, error_message)
+        """
         if state is None:
             return (
                 False,
@@ -140,7 +189,7 @@ class LightController:
                 f"Light entity '{entity_id}' does not exist",
             )
 
-        if state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        if state.state in _UNAVAILABLE_STATES:
             return (
                 False,
                 LightError.UNAVAILABLE,
@@ -148,11 +197,11 @@ class LightController:
             )
 
         # Check for RGB support
-        supported_modes = state.attributes.get(ATTR_SUPPORTED_COLOR_MODES, [])
+        supported_modes = state.attributes.get(ATTR_SUPPORTED_COLOR_MODES, ())
         if supported_modes:
-            # Convert to set for comparison
-            supported_set = set(supported_modes)
-            if not supported_set & self.RGB_COLOR_MODES:
+            # Membership tests against the frozenset; no per-call set is built
+            rgb_modes = self.RGB_COLOR_MODES
+            if not any(mode in rgb_modes for mode in supported_modes):
                 return (
                     False,
                     LightError.NO_RGB_SUPPORT,
@@ -193,36 +242,65 @@ class LightController:
                     error_message=error_msg,
                 )
 
-        transition_time = transition if transition is not None else self.transition_time
+        template = self._service_data_template(transition, brightness)
+        return (await self._async_apply_color([entity_id], color, template, brightness))[0]
 
-        # Build service call data
-        service_data = {
-            ATTR_ENTITY_ID: entity_id,
-            ATTR_RGB_COLOR: list(color),
-            ATTR_TRANSITION: transition_time,
-        }
+    def _service_data_template(self, transition: float | None, brightness: int | None) -> dict[str, Any]:
+        """Build the turn_on data shared by every light in one apply.
+
+        Args:
+            transition: Transition time in seconds (uses default if None)
+            brightness: Brightness percentage (1-100), converted to 0-255 for HA
+
+        Returns:
+            Service data with the transition and, if given, the HA brightness
+        """
+        template: dict[str, Any] = {ATTR_TRANSITION: transition if transition is not None else self.transition_time}
+        if brightness is not None:
+            template[ATTR_BRIGHTNESS] = int((brightness / 100) * 255)
+        return template
+
+    async def _async_apply_color(
+        self,
+        entity_ids: list[str],
+        color: RGBColor,
+        template: dict[str, Any],
+        brightness: int | None,
+    ) -> list[LightResult]:
+        """Apply one RGB color to a group of lights with a single service call.
+
+        Args:
+            entity_ids: The light entity IDs receiving the color
+            color: RGB color tuple (r, g, b)
+            template: Shared service data from _service_data_template
+            brightness: Brightness percentage the template was built from, for logging
+
+        Returns:
+            A LightResult per entity, in the order given
+        """
+        # light.turn_on fans a list of entity IDs out to every light itself
+        target: str | list[str] = entity_ids[0] if len(entity_ids) == 1 else entity_ids
+        # The light service schema coerces the color to a tuple itself, so pass it as is
+        service_data = {**template, ATTR_ENTITY_ID: target, ATTR_RGB_COLOR: color}
 
-        # Add brightness if specified (convert from 1-100% to 0-255)
         if brightness is not None:
-            ha_brightness = int((brightness / 100) * 255)
-            service_data[ATTR_BRIGHTNESS] = ha_brightness
             _LOGGER.info(
-                "Applying color RGB(%d, %d, %d) to %s (transition=%ds, brightness=%d%%)",
+                "Applying color RGB(%d, %d, %d) to %s (transition=%ss, brightness=%d%%)",
                 color[0],
                 color[1],
                 color[2],
-                entity_id,
-                transition_time,
+                target,
+                template[ATTR_TRANSITION],
                 brightness,
             )
         else:
             _LOGGER.info(
-                "Applying color RGB(%d, %d, %d) to %s (transition=%ds)",
+                "Applying color RGB(%d, %d, %d) to %s (transition=%ss)",
                 color[0],
                 color[1],
                 color[2],
-                entity_id,
-                transition_time,
+                target,
+                template[ATTR_TRANSITION],
             )
 
         try:
@@ -232,22 +310,28 @@ class LightController:
                 service_data,
                 blocking=True,
             )
-            _LOGGER.debug("Successfully applied color to %s", entity_id)
-            return LightResult(
-                entity_id=entity_id,
-                success=True,
-                color=color,
-            )
+            _LOGGER.debug("Successfully applied color to %s", target)
+            return [LightResult(entity_id=entity_id, success=True, color=color) for entity_id in entity_ids]
         except Exception as e:
-            error_msg = f"Failed to apply color to {entity_id}: {e}"
+            if len(entity_ids) > 1:
+                # One failing light fails the whole group call, although the
+                # others may have changed; retry each light alone so every
+                # result reflects that light's own outcome
+                _LOGGER.debug("Group call for %s failed (%s), retrying each light", target, e)
+                retries = await asyncio.gather(*(self._async_apply_color([entity_id], color, template, brightness) for entity_id in entity_ids))
+                return [light_result for light_results in retries for light_result in light_results]
+
+            error_msg = f"Failed to apply color to {target}: {e}"
             _LOGGER.error(error_msg)
-            return LightResult(
-                entity_id=entity_id,
-                success=False,
-                color=color,
-                error=LightError.SERVICE_CALL_FAILED,
-                error_message=error_msg,
-            )
+            return [
+                LightResult(
+                    entity_id=target,
+                    success=False,
+                    color=color,
+                    error=LightError.SERVICE_CALL_FAILED,
+                    error_message=error_msg,
+                )
+            ]
 
     async def apply_colors_to_lights(
         self,
@@ -269,12 +353,12 @@ class LightController:
 
         # First check all lights for availability
         available_lights: dict[str, RGBColor] = {}
-        for entity_id, color in light_colors.items():
-            is_available, error, error_msg = self.check_light_availability(entity_id)
+        availability = self.check_lights_availability(light_colors)
+        for (entity_id, color), (is_available, error, error_msg) in zip(light_colors.items(), availability, strict=True):
             if is_available:
                 available_lights[entity_id] = color
             else:
-                result.results.append(
+                result.add(
                     LightResult(
                         entity_id=entity_id,
                         success=False,
@@ -284,16 +368,19 @@ class LightController:
                 )
                 _LOGGER.warning("Skipping unavailable light: %s", error_msg)
 
-        # Apply colors to available lights
+        # Lights sharing a color get one service call between them
+        color_groups: dict[RGBColor, list[str]] = {}
         for entity_id, color in available_lights.items():
-            light_result = await self.apply_color_to_light(
-                entity_id,
-                color,
-                transition=transition,
-                brightness=brightness,
-                skip_availability_check=True,  # Already checked
-            )
-            result.results.append(light_result)
+            color_groups.setdefault(tuple(color), []).append(entity_id)
+
+        # Apply colors to available lights concurrently; _async_apply_color
+        # reports service call failures in its results rather than raising
+        template = self._service_data_template(transition, brightness)
+        group_results = await asyncio.gather(
+            *(self._async_apply_color(entity_ids, color, template, brightness) for color, entity_ids in color_groups.items())
+        )
+        results_by_entity = {light_result.entity_id: light_result for light_results in group_results for light_result in light_results}
+        result.extend(results_by_entity[entity_id] for entity_id in available_lights)
 
         # Log summary
         if result.all_succeeded:
@@ -311,9 +398,10 @@ class LightController:
 
 
 def get_light_controller(hass: HomeAssistant) -> LightController:
-    """Get or create a LightController instance.
+    """Get the shared LightController, creating it on first use.
 
-    This can be extended to cache the controller in hass.data if needed.
+    The controller is kept in hass.data so every entry and service call
+    shares one instance; it is dropped when the last entry unloads.
 
     Args:
         hass: Home Assistant instance
@@ -321,4 +409,9 @@ def get_light_controller(hass: HomeAssistant) -> LightController:
     Returns:
         LightController instance
     """
-    return LightController(hass)
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    controller: LightController | None = domain_data.get("light_controller")
+    if controller is None:
+        controller = domain_data["light_controller"] = LightController(hass)
+        _LOGGER.debug("Created LightController")
+    return controller
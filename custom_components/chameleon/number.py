@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from typing import Any
 
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
@@ -11,6 +13,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
+    BRIGHTNESS_DEBOUNCE_DELAY,
     CONF_ANIMATION_SPEED,
     CONF_LIGHT_ENTITIES,
     CONF_LIGHT_ENTITY,
@@ -22,10 +25,13 @@ from .const import (
     MIN_ANIMATION_SPEED,
     MIN_BRIGHTNESS,
 )
-from .helpers import get_chameleon_device_name, get_entity_base_name
+from .helpers import get_chameleon_device_info, get_entity_base_name
 
 _LOGGER = logging.getLogger(__name__)
 
+# Home Assistant brightness (0-255) for each whole slider percentage
+_BRIGHTNESS_255 = tuple(int((percent / 100) * 255) for percent in range(MAX_BRIGHTNESS + 1))
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -73,12 +79,17 @@ class ChameleonBrightnessNumber(NumberEntity):
         """Initialize the brightness number entity."""
         self.hass = hass
         self._entry = entry
+        # Runtime settings shared with the select entity; created by async_setup_entry
+        self._entry_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {})
         self._light_entities = light_entities
         self._brightness = DEFAULT_BRIGHTNESS
+        # Debounced brightness update, replaced by each new slider value
+        self._apply_task: asyncio.Task[None] | None = None
 
         # Generate unique ID and entity ID with chameleon_ prefix
         base_name = get_entity_base_name(hass, light_entities)
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_brightness"
+        self._attr_device_info = get_chameleon_device_info(hass, entry.entry_id, light_entities)
         self.entity_id = f"number.chameleon_{base_name}_brightness"
 
         _LOGGER.debug(
@@ -87,70 +98,68 @@ class ChameleonBrightnessNumber(NumberEntity):
             self._attr_unique_id,
         )
 
-    @property
-    def device_info(self):
-        """Return device info for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": get_chameleon_device_name(self.hass, self._light_entities),
-            "manufacturer": "Chameleon",
-            "model": "Scene Selector",
-        }
-
     @property
     def native_value(self) -> float:
         """Return the current brightness value."""
         return self._brightness
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending brightness update when the entity is removed."""
+        await super().async_will_remove_from_hass()
+        if self._apply_task is not None:
+            self._apply_task.cancel()
+
     async def async_set_native_value(self, value: float) -> None:
         """Set the brightness value and apply to lights."""
         self._brightness = int(value)
         _LOGGER.info("Brightness set to %d%% for %s", self._brightness, self._light_entities)
 
         # Store brightness in hass.data for select entity to use
-        if DOMAIN not in self.hass.data:
-            self.hass.data[DOMAIN] = {}
-        if self._entry.entry_id not in self.hass.data[DOMAIN]:
-            self.hass.data[DOMAIN][self._entry.entry_id] = {}
-
-        self.hass.data[DOMAIN][self._entry.entry_id]["brightness"] = self._brightness
+        self._entry_data["brightness"] = self._brightness
 
-        # Apply brightness to lights immediately
-        await self._apply_brightness_to_lights()
+        # Dragging the slider sends a burst of values; only the last one that
+        # settles for BRIGHTNESS_DEBOUNCE_DELAY reaches the lights
+        if self._apply_task is not None:
+            self._apply_task.cancel()
+        self._apply_task = self.hass.async_create_task(self._apply_brightness_to_lights())
 
         self.async_write_ha_state()
 
     async def _apply_brightness_to_lights(self) -> None:
-        """Apply the current brightness to all configured lights."""
+        """Apply the current brightness to all configured lights once the slider settles."""
+        await asyncio.sleep(BRIGHTNESS_DEBOUNCE_DELAY)
+
         # Convert percentage to HA brightness (0-255)
-        ha_brightness = int((self._brightness / 100) * 255)
-
-        for light_entity in self._light_entities:
-            try:
-                await self.hass.services.async_call(
-                    "light",
-                    "turn_on",
-                    {
-                        "entity_id": light_entity,
-                        "brightness": ha_brightness,
-                    },
-                    blocking=True,
-                )
-                _LOGGER.debug(
-                    "Applied brightness %d (%d%%) to %s",
-                    ha_brightness,
-                    self._brightness,
-                    light_entity,
-                )
-            except Exception:
-                _LOGGER.exception("Failed to apply brightness to %s", light_entity)
+        ha_brightness = _BRIGHTNESS_255[self._brightness]
+
+        # light.turn_on fans a list of entity IDs out to every light itself. The
+        # call blocks only this debounced task, not the slider, and blocking
+        # lets device failures reach the handler below
+        try:
+            await self.hass.services.async_call(
+                "light",
+                "turn_on",
+                {
+                    "entity_id": self._light_entities,
+                    "brightness": ha_brightness,
+                },
+                blocking=True,
+            )
+            _LOGGER.debug(
+                "Applied brightness %d (%d%%) to %s",
+                ha_brightness,
+                self._brightness,
+                self._light_entities,
+            )
+        except Exception:
+            _LOGGER.exception("Failed to apply brightness to %s", self._light_entities)
 
     @property
     def extra_state_attributes(self):
         """Return extra state attributes."""
         return {
             "light_entities": self._light_entities,
-            "brightness_255": int((self._brightness / 100) * 255),
+            "brightness_255": _BRIGHTNESS_255[self._brightness],
         }
 
 
@@ -176,12 +185,16 @@ class ChameleonAnimationSpeedNumber(NumberEntity):
         """Initialize the animation speed number entity."""
         self.hass = hass
         self._entry = entry
+        # Runtime settings shared with the select entity; created by async_setup_entry
+        self._entry_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {})
         self._light_entities = light_entities
         self._speed = initial_speed
 
         # Generate unique ID and entity ID with chameleon_ prefix
         base_name = get_entity_base_name(hass, light_entities)
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_animation_speed"
+        self._attr_device_info = get_chameleon_device_info(hass, entry.entry_id, light_entities)
+        self._attr_extra_state_attributes = {"light_entities": light_entities}
         self.entity_id = f"number.chameleon_{base_name}_animation_speed"
 
         _LOGGER.debug(
@@ -191,16 +204,6 @@ class ChameleonAnimationSpeedNumber(NumberEntity):
             self._speed,
         )
 
-    @property
-    def device_info(self):
-        """Return device info for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": get_chameleon_device_name(self.hass, self._light_entities),
-            "manufacturer": "Chameleon",
-            "model": "Scene Selector",
-        }
-
     @property
     def native_value(self) -> float:
         """Return the current animation speed value."""
@@ -212,18 +215,6 @@ class ChameleonAnimationSpeedNumber(NumberEntity):
         _LOGGER.info("Animation speed set to %.1fs for %s", self._speed, self._light_entities)
 
         # Store animation speed in hass.data for other entities to use
-        if DOMAIN not in self.hass.data:
-            self.hass.data[DOMAIN] = {}
-        if self._entry.entry_id not in self.hass.data[DOMAIN]:
-            self.hass.data[DOMAIN][self._entry.entry_id] = {}
-
-        self.hass.data[DOMAIN][self._entry.entry_id]["animation_speed"] = self._speed
+        self._entry_data["animation_speed"] = self._speed
 
         self.async_write_ha_state()
-
-    @property
-    def extra_state_attributes(self):
-        """Return extra state attributes."""
-        return {
-            "light_entities": self._light_entities,
-        }
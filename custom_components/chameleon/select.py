@@ -4,20 +4,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import random
+from collections import OrderedDict
 from datetime import datetime
-from pathlib import Path
-from typing import TYPE_CHECKING
+from itertools import cycle
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later
 
 from .color_extractor import (
     RGBColor,
     extract_color_palette,
+    extract_colors,
     extract_dominant_color,
     generate_gradient_path,
 )
@@ -30,20 +33,31 @@ from .const import (
     DEFAULT_COLOR_COUNT,
     DEFAULT_SYNC_ANIMATION,
     DOMAIN,
+    GRADIENT_CACHE_SIZE,
     IMAGE_DIRECTORY,
     OPTIONS_CACHE_INTERVAL,
+    OPTIONS_CACHE_MAX_INTERVAL,
+    PALETTE_CACHE_SIZE,
+    PREFETCH_CONCURRENCY,
     SCENE_OFF,
     SCENE_RANDOM,
     SUPPORTED_EXTENSIONS,
 )
-from .helpers import get_chameleon_device_name, get_entity_base_name
-from .light_controller import ApplyColorsResult, LightController
+from .helpers import get_chameleon_device_info, get_entity_base_name
+from .light_controller import ApplyColorsResult, LightController, LightResult
 
 if TYPE_CHECKING:
     from .animations import AnimationManager
 
 _LOGGER = logging.getLogger(__name__)
 
+# Lowercased extensions mapped to their SUPPORTED_EXTENSIONS index, for a single
+# dict lookup per directory entry that also ranks duplicate scene names
+_EXTENSION_RANK = {ext.lower(): rank for rank, ext in enumerate(SUPPORTED_EXTENSIONS)}
+
+# Filename separators that become spaces in scene names
+_SEPARATOR_TABLE = str.maketrans("_-", "  ")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -87,8 +101,8 @@ async def async_setup_entry(
 
 def _scene_name_from_filename(filename: str) -> str:
     """Convert filename to human-readable scene name."""
-    # Remove extension and convert underscores/hyphens to spaces, then title case
-    return filename.replace("_", " ").replace("-", " ").title()
+    # Convert underscores/hyphens to spaces in one pass, then title case
+    return filename.translate(_SEPARATOR_TABLE).title()
 
 
 class ChameleonSceneSelect(SelectEntity):
@@ -108,6 +122,8 @@ class ChameleonSceneSelect(SelectEntity):
         """Initialize the select entity."""
         self.hass = hass
         self._entry = entry
+        # Runtime settings written by the switch and number entities; created by async_setup_entry
+        self._entry_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {})
         self._light_entities = light_entities
         self._animation_enabled = animation_enabled
         self._animation_speed = animation_speed
@@ -117,6 +133,7 @@ class ChameleonSceneSelect(SelectEntity):
 
         # Palette and diagnostics tracking
         self._extracted_palette: list[RGBColor] = []  # Full extracted palette
+        self._gradient_cache: OrderedDict[tuple[RGBColor, ...], tuple[RGBColor, ...]] = OrderedDict()  # Palette -> gradient
         self._last_scene_change: datetime | None = None  # Timestamp for automation triggers
 
         # Error tracking for UI feedback
@@ -124,16 +141,24 @@ class ChameleonSceneSelect(SelectEntity):
         self._failed_lights: dict[str, str] = {}  # entity_id -> error message
 
         # Options caching - stores scene name -> file path mapping
-        self._cached_options: list[str] = []
-        self._scene_to_path: dict[str, Path] = {}  # Maps scene names to actual file paths
+        self._cached_options: tuple[str, ...] = ()
+        # Full option list reported to HA, rebuilt only when the scenes change
+        self._options: list[str] = [SCENE_OFF, SCENE_RANDOM]
+        self._scene_to_path: dict[str, str] = {}  # Maps scene names to actual file paths
+        self._scene_to_path_lower: dict[str, str] = {}  # Same mapping keyed by lowercase scene name
+        self._dir_mtime_ns: int | None = None  # Image directory mtime at last scan
+        self._refresh_task: asyncio.Task[None] | None = None  # Scan in progress, shared by concurrent refreshes
         self._options_cache_unsub: asyncio.TimerHandle | None = None
+        self._refresh_interval = OPTIONS_CACHE_INTERVAL  # Delay before the next periodic refresh
 
-        # Light controller for shared logic
-        self._light_controller = LightController(hass)
+        # Light controller and animation manager shared by all entries (created in async_setup_entry)
+        self._light_controller: LightController = hass.data[DOMAIN]["light_controller"]
+        self._animation_manager: AnimationManager | None = hass.data[DOMAIN].get("animation_manager")
 
         # Generate unique ID and entity ID with chameleon_ prefix
         base_name = get_entity_base_name(hass, light_entities)
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_scene"
+        self._attr_device_info = get_chameleon_device_info(hass, entry.entry_id, light_entities)
         self.entity_id = f"select.chameleon_{base_name}_scene"
 
         _LOGGER.debug(
@@ -143,48 +168,32 @@ class ChameleonSceneSelect(SelectEntity):
         )
 
     def _get_animation_manager(self) -> AnimationManager | None:
-        """Get the AnimationManager from hass.data."""
-        return self.hass.data.get(DOMAIN, {}).get("animation_manager")
+        """Get the shared AnimationManager looked up at init."""
+        return self._animation_manager
 
     def _get_runtime_animation_enabled(self) -> bool:
         """Get animation enabled state from runtime data (switch) or fall back to config."""
-        entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        return entry_data.get("animation_enabled", self._animation_enabled)
+        return self._entry_data.get("animation_enabled", self._animation_enabled)
 
     def _get_runtime_brightness(self) -> int:
         """Get brightness from runtime data (number slider) or fall back to default."""
-        entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        return entry_data.get("brightness", DEFAULT_BRIGHTNESS)
+        return self._entry_data.get("brightness", DEFAULT_BRIGHTNESS)
 
     def _get_runtime_animation_speed(self) -> float:
         """Get animation speed from runtime data (number slider) or fall back to config."""
-        entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        return entry_data.get("animation_speed", self._animation_speed)
+        return self._entry_data.get("animation_speed", self._animation_speed)
 
     def _get_runtime_sync_animation(self) -> bool:
         """Get sync animation state from runtime data (switch) or fall back to default."""
-        entry_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id, {})
-        return entry_data.get("sync_animation", DEFAULT_SYNC_ANIMATION)
+        return self._entry_data.get("sync_animation", DEFAULT_SYNC_ANIMATION)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         await super().async_added_to_hass()
 
-        # Initial options scan
+        # Initial options scan; every scan schedules the next periodic refresh
         await self._async_refresh_options()
 
-        # Set up periodic options refresh
-        self._options_cache_unsub = async_track_time_interval(
-            self.hass,
-            self._async_refresh_options_callback,
-            OPTIONS_CACHE_INTERVAL,
-        )
-
-        _LOGGER.debug(
-            "Options cache refresh scheduled every %s seconds",
-            OPTIONS_CACHE_INTERVAL.total_seconds(),
-        )
-
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity is being removed."""
         await super().async_will_remove_from_hass()
@@ -192,11 +201,16 @@ class ChameleonSceneSelect(SelectEntity):
         # Stop any running animations for our lights
         await self._stop_animations()
 
-        # Cancel the options refresh timer
+        # Cancel the options refresh timer, and any scan that would reschedule it
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
         if self._options_cache_unsub is not None:
             self._options_cache_unsub()
             self._options_cache_unsub = None
 
+        # Invalidate the scan cache so a re-added entity rescans from scratch
+        self._dir_mtime_ns = None
+
     async def _stop_animations(self) -> None:
         """Stop animations for all lights managed by this entity."""
         animation_manager = self._get_animation_manager()
@@ -209,16 +223,87 @@ class ChameleonSceneSelect(SelectEntity):
     @callback
     def _async_refresh_options_callback(self, _now: object = None) -> None:
         """Callback wrapper for async_refresh_options."""
+        self._options_cache_unsub = None
         self.hass.async_create_task(self._async_refresh_options())
 
-    async def _async_refresh_options(self) -> None:
-        """Refresh the cached options list by scanning the image directory."""
-        new_options, new_scene_to_path = await self.hass.async_add_executor_job(self._scan_image_directory)
+    @callback
+    def _async_schedule_refresh(self, changed: bool) -> None:
+        """Schedule the next periodic refresh after a scan.
+
+        The interval doubles after each scan that finds the scene list
+        unchanged, up to OPTIONS_CACHE_MAX_INTERVAL, and drops back to
+        OPTIONS_CACHE_INTERVAL as soon as a scan finds a change. Scenes added
+        while backed off still show up on a scene cache miss or a refresh
+        button press.
+
+        Args:
+            changed: Whether the scan changed the scene list
+        """
+        if changed:
+            self._refresh_interval = OPTIONS_CACHE_INTERVAL
+        else:
+            self._refresh_interval = min(self._refresh_interval * 2, OPTIONS_CACHE_MAX_INTERVAL)
+
+        if self._options_cache_unsub is not None:
+            self._options_cache_unsub()
+        self._options_cache_unsub = async_call_later(self.hass, self._refresh_interval, self._async_refresh_options_callback)
+        _LOGGER.debug("Next options refresh in %s seconds", self._refresh_interval.total_seconds())
+
+    async def _async_refresh_options(self, force: bool = False) -> None:
+        """Refresh the cached options list by scanning the image directory.
+
+        The timer, a scene cache miss and the refresh button can all ask for a
+        refresh at once; callers arriving while a scan is running wait for that
+        scan rather than starting another one.
+
+        Args:
+            force: Rescan even if the directory appears unchanged
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = self.hass.async_create_task(self._async_scan_options(force))
+        # Shielded so a cancelled caller does not cancel the scan for the others
+        await asyncio.shield(self._refresh_task)
+
+    async def _async_scan_options(self, force: bool) -> None:
+        """Scan the image directory and update the cached options.
+
+        The scan is skipped when the directory mtime is unchanged since the last
+        scan, since adding, removing or renaming an image always bumps it.
+
+        Args:
+            force: Rescan even if the directory appears unchanged
+        """
+        last_mtime_ns = None if force else self._dir_mtime_ns
+        try:
+            scan = await self.hass.async_add_executor_job(self._scan_image_directory, last_mtime_ns)
+        except OSError as e:
+            # e.g. a permission error or a stale network mount; keep the last
+            # known scenes and re-arm the timer, since each scan schedules the next
+            _LOGGER.warning("Failed to scan image directory %s: %s", IMAGE_DIRECTORY, e)
+            self._async_schedule_refresh(changed=False)
+            return
+
+        if scan is None:
+            _LOGGER.debug("Image directory unchanged, skipping rescan (%d scenes)", len(self._cached_options))
+            self._async_schedule_refresh(changed=False)
+            return
+
+        new_options, new_scene_to_path, self._dir_mtime_ns = scan
+        new_scenes = new_scene_to_path.keys() - self._scene_to_path.keys()
+        self._scene_to_path = new_scene_to_path
+        self._scene_to_path_lower = {scene.lower(): path for scene, path in new_scene_to_path.items()}
+
+        if new_scenes:
+            # Extract colors for new images ahead of time so selecting them is instant
+            self.hass.async_create_background_task(
+                self._async_prefetch_colors([new_scene_to_path[scene] for scene in sorted(new_scenes)]),
+                f"{DOMAIN} palette prefetch {self.entity_id}",
+            )
 
         if new_options != self._cached_options:
             old_count = len(self._cached_options)
             self._cached_options = new_options
-            self._scene_to_path = new_scene_to_path
+            self._options = [SCENE_OFF, SCENE_RANDOM, *new_options]
             _LOGGER.debug(
                 "Options cache updated: %d -> %d scenes",
                 old_count,
@@ -226,42 +311,98 @@ class ChameleonSceneSelect(SelectEntity):
             )
             # Notify HA of state change if options changed
             self.async_write_ha_state()
+            self._async_schedule_refresh(changed=True)
         else:
             _LOGGER.debug("Options cache unchanged (%d scenes)", len(new_options))
+            self._async_schedule_refresh(changed=False)
 
-    def _scan_image_directory(self) -> tuple[list[str], dict[str, Path]]:
-        """Scan image directory for available scenes (runs in executor).
+    def _palette_color_count(self, animated: bool) -> int:
+        """Return the palette size scene applies extract for this entity.
+
+        Args:
+            animated: Whether the palette is for an animation or static colors
 
         Returns:
-            Tuple of (sorted scene names list, scene name to file path mapping)
+            Number of palette colors to extract
         """
-        image_dir = Path(IMAGE_DIRECTORY)
+        if animated:
+            return DEFAULT_COLOR_COUNT
+        # Static colors are spread one per light
+        return max(len(self._light_entities), DEFAULT_COLOR_COUNT)
 
-        if not image_dir.exists():
-            _LOGGER.warning("Image directory does not exist: %s", IMAGE_DIRECTORY)
-            return [], {}
+    async def _async_prefetch_colors(self, image_paths: list[str]) -> None:
+        """Extract and cache the colors scene applies will need for these images.
 
-        scene_to_path: dict[str, Path] = {}
-        for ext in SUPPORTED_EXTENSIONS:
-            for image_path in image_dir.glob(f"*{ext}"):
-                scene_name = _scene_name_from_filename(image_path.stem)
-                # Only store first match if duplicate scene names exist
-                if scene_name not in scene_to_path:
-                    scene_to_path[scene_name] = image_path
+        At most PREFETCH_CONCURRENCY images are decoded at once, so the first
+        scan of a large directory does not flood the shared executor. Only as
+        many images as the extraction cache holds are prefetched, since more
+        would evict each other's results.
 
-        scenes = sorted(scene_to_path.keys())
-        _LOGGER.debug("Found %d scenes in %s: %s", len(scenes), IMAGE_DIRECTORY, scenes)
-        return scenes, scene_to_path
+        Args:
+            image_paths: Paths of newly found scene images
+        """
+        single_light = len(self._light_entities) == 1
+        # Warm the cache key of the mode scenes are currently applied in
+        color_count = self._palette_color_count(self._get_runtime_animation_enabled())
+        # A single light caches two results per image (dominant color and palette)
+        limit = PALETTE_CACHE_SIZE // 2 if single_light else PALETTE_CACHE_SIZE
+        semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+        async def prefetch(image_path: str) -> None:
+            async with semaphore:
+                if single_light:
+                    # Static mode uses the dominant color and animated mode the
+                    # palette; decode each image once for both
+                    await extract_colors(self.hass, image_path, color_count)
+                else:
+                    await extract_color_palette(self.hass, image_path, color_count)
+
+        await asyncio.gather(*(prefetch(image_path) for image_path in image_paths[:limit]))
+
+    def _scan_image_directory(self, last_mtime_ns: int | None = None) -> tuple[tuple[str, ...], dict[str, str], int | None] | None:
+        """Scan image directory for available scenes (runs in executor).
 
-    @property
-    def device_info(self):
-        """Return device info for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": get_chameleon_device_name(self.hass, self._light_entities),
-            "manufacturer": "Chameleon",
-            "model": "Scene Selector",
-        }
+        Args:
+            last_mtime_ns: Directory mtime from the previous scan, if any
+
+        Returns:
+            Tuple of (sorted scene names, scene name to file path mapping, directory mtime),
+            or None if the directory mtime still matches last_mtime_ns
+        """
+        try:
+            mtime_ns = os.stat(IMAGE_DIRECTORY).st_mtime_ns
+        except FileNotFoundError:
+            _LOGGER.warning("Image directory does not exist: %s", IMAGE_DIRECTORY)
+            return (), {}, None
+
+        if mtime_ns == last_mtime_ns:
+            return None
+
+        # Single directory pass instead of one glob per extension
+        found: dict[str, tuple[int, str, str]] = {}  # scene -> (extension rank, filename, path)
+        with os.scandir(IMAGE_DIRECTORY) as entries:
+            for entry in entries:
+                name = entry.name
+                dot = name.rfind(".")
+                # Skip hidden files (e.g. macOS "._" resource forks) like glob does
+                if dot <= 0 or name[0] == ".":
+                    continue
+                rank = _EXTENSION_RANK.get(name[dot:].lower())
+                if rank is None or not entry.is_file():
+                    continue
+                # Duplicate scene names (beach.jpg, beach.png) resolve by
+                # SUPPORTED_EXTENSIONS order, then filename, never scandir order
+                scene = _scene_name_from_filename(name[:dot])
+                candidate = (rank, name, entry.path)
+                current = found.get(scene)
+                if current is None or candidate < current:
+                    found[scene] = candidate
+
+        scene_to_path = {scene: path for scene, (_, _, path) in found.items()}
+
+        scenes = tuple(sorted(scene_to_path))
+        _LOGGER.debug("Found %d scenes in %s: %s", len(scenes), IMAGE_DIRECTORY, scenes)
+        return scenes, scene_to_path, mtime_ns
 
     @property
     def extra_state_attributes(self):
@@ -300,7 +441,7 @@ class ChameleonSceneSelect(SelectEntity):
         - 'Off': Turn off all lights
         - 'Random': Pick a random scene from available images
         """
-        return [SCENE_OFF, SCENE_RANDOM, *self._cached_options]
+        return self._options
 
     @property
     def current_option(self) -> str | None:
@@ -351,21 +492,23 @@ class ChameleonSceneSelect(SelectEntity):
 
         # Find the image file for this scene
         image_path = await self._find_image_for_scene(option)
-
-        if image_path is None:
+        result = await self._apply_scene_image(image_path, animation_enabled, brightness) if image_path else None
+
+        # The cached path goes stale when an image is deleted or replaced (e.g.
+        # sunset.jpg swapped for sunset.png); extraction then fails, so rescan
+        # and retry instead of waiting for the next periodic refresh
+        if result is not None and not result.results and not await self.hass.async_add_executor_job(os.path.isfile, image_path):
+            _LOGGER.debug("Image for scene '%s' is gone (%s), rescanning", option, image_path)
+            await self._async_refresh_options(force=True)
+            image_path = self._lookup_scene_path(option)
+            result = await self._apply_scene_image(image_path, animation_enabled, brightness) if image_path else None
+
+        if result is None:
             self._last_error = f"Image not found for scene: {option}"
             _LOGGER.error(self._last_error)
             self.async_write_ha_state()
             return
 
-        _LOGGER.debug("Found image for scene '%s': %s", option, image_path)
-
-        # Extract colors and apply to lights (static or animated)
-        if animation_enabled:
-            result = await self._apply_colors_animated(image_path, brightness)
-        else:
-            result = await self._apply_colors_static(image_path, brightness)
-
         # Update state based on result
         if result.all_succeeded:
             # All lights updated successfully
@@ -399,7 +542,25 @@ class ChameleonSceneSelect(SelectEntity):
 
         self.async_write_ha_state()
 
-    async def _apply_colors_static(self, image_path: Path, brightness: int = 100) -> ApplyColorsResult:
+    async def _apply_scene_image(self, image_path: str, animation_enabled: bool, brightness: int) -> ApplyColorsResult:
+        """Extract colors from a scene image and apply them to the lights.
+
+        Args:
+            image_path: Path of the scene image
+            animation_enabled: Start an animation instead of applying static colors
+            brightness: Brightness percentage (1-100)
+
+        Returns:
+            ApplyColorsResult, with no results if extraction failed
+        """
+        _LOGGER.debug("Found image for scene: %s", image_path)
+
+        # Extract colors and apply to lights (static or animated)
+        if animation_enabled:
+            return await self._apply_colors_animated(image_path, brightness)
+        return await self._apply_colors_static(image_path, brightness)
+
+    async def _apply_colors_static(self, image_path: str, brightness: int = 100) -> ApplyColorsResult:
         """Extract colors from image and apply statically to lights."""
         num_lights = len(self._light_entities)
 
@@ -423,7 +584,7 @@ class ChameleonSceneSelect(SelectEntity):
             colors = await extract_color_palette(
                 self.hass,
                 image_path,
-                color_count=max(num_lights, DEFAULT_COLOR_COUNT),
+                color_count=self._palette_color_count(animated=False),
             )
 
             if not colors:
@@ -435,18 +596,41 @@ class ChameleonSceneSelect(SelectEntity):
             # Store extracted palette for state attributes
             self._extracted_palette = colors
 
-            # Build light -> color mapping
-            light_colors = {}
-            for i, light_entity in enumerate(self._light_entities):
-                color = colors[i % len(colors)]  # Cycle if fewer colors than lights
-                light_colors[light_entity] = color
+            # Build light -> color mapping, cycling if fewer colors than lights
+            light_colors = dict(zip(self._light_entities, cycle(colors), strict=False))
 
             return await self._light_controller.apply_colors_to_lights(
                 light_colors,
                 brightness=brightness,
             )
 
-    async def _apply_colors_animated(self, image_path: Path, brightness: int = 100) -> ApplyColorsResult:
+    def _gradient_for(self, colors: list[RGBColor]) -> tuple[RGBColor, ...]:
+        """Return the animation gradient for a palette, reusing recent results.
+
+        Re-selecting a scene (or switching animation modes) yields the same
+        palette, so its gradient is served from a small LRU instead of being
+        regenerated. The palette changes when its image does, so stale
+        gradients are never returned.
+
+        Args:
+            colors: Palette extracted from the scene image
+
+        Returns:
+            The gradient path as an immutable tuple
+        """
+        key = tuple(colors)
+        gradient = self._gradient_cache.get(key)
+        if gradient is not None:
+            self._gradient_cache.move_to_end(key)
+            return gradient
+
+        gradient = tuple(generate_gradient_path(colors, steps_between=10))
+        self._gradient_cache[key] = gradient
+        if len(self._gradient_cache) > GRADIENT_CACHE_SIZE:
+            self._gradient_cache.popitem(last=False)
+        return gradient
+
+    async def _apply_colors_animated(self, image_path: str, brightness: int = 100) -> ApplyColorsResult:
         """Extract colors from image and start animation for lights.
 
         Supports two animation modes controlled by the sync_animation switch:
@@ -466,7 +650,7 @@ class ChameleonSceneSelect(SelectEntity):
         colors = await extract_color_palette(
             self.hass,
             image_path,
-            color_count=DEFAULT_COLOR_COUNT,
+            color_count=self._palette_color_count(animated=True),
         )
 
         if not colors:
@@ -476,8 +660,8 @@ class ChameleonSceneSelect(SelectEntity):
         # Store extracted palette for state attributes
         self._extracted_palette = colors
 
-        # Generate smooth gradient path for animation
-        gradient = generate_gradient_path(colors, steps_between=10)
+        # Generate smooth gradient path for animation (immutable, shared by all controllers)
+        gradient = self._gradient_for(colors)
         _LOGGER.debug(
             "Generated gradient path with %d colors from %d palette colors",
             len(gradient),
@@ -485,20 +669,19 @@ class ChameleonSceneSelect(SelectEntity):
         )
 
         # Check availability of all lights first
-        from .light_controller import LightResult
-
-        results = []
+        results: list[LightResult] = []
         available_lights = []
+        availability = self._light_controller.check_lights_availability(self._light_entities)
+        first_color = gradient[0] if gradient else None
 
-        for light_entity in self._light_entities:
-            is_available, error, error_msg = self._light_controller.check_light_availability(light_entity)
+        for light_entity, (is_available, error, error_msg) in zip(self._light_entities, availability, strict=True):
             if is_available:
                 available_lights.append(light_entity)
                 results.append(
                     LightResult(
                         entity_id=light_entity,
                         success=True,
-                        color=gradient[0] if gradient else None,
+                        color=first_color,
                     )
                 )
             else:
@@ -543,28 +726,28 @@ class ChameleonSceneSelect(SelectEntity):
         self._is_animating = True
         return ApplyColorsResult(results=results)
 
-    async def _find_image_for_scene(self, scene_name: str) -> Path | None:
+    async def _find_image_for_scene(self, scene_name: str) -> str | None:
         """Find the image file path for a given scene name.
 
         Uses the cached scene-to-path mapping built during directory scan.
         This properly handles filenames with spaces, underscores, or any other characters.
+        A cache hit is a plain dict read; only a miss touches the filesystem (via a rescan
+        in the executor). A path whose image was since removed is caught by
+        async_select_option when extraction fails, which forces a rescan.
         """
         # First, try the cached mapping (most reliable, handles spaces in filenames)
-        if scene_name in self._scene_to_path:
-            image_path = self._scene_to_path[scene_name]
-            if image_path.exists():
-                _LOGGER.debug("Found image from cache: scene='%s' -> %s", scene_name, image_path)
-                return image_path
-            # Path cached but file no longer exists - will fall through to rescan
-
-        # Cache miss or stale cache - refresh and try again
+        image_path = self._lookup_scene_path(scene_name)
+        if image_path is not None:
+            _LOGGER.debug("Found image from cache: scene='%s' -> %s", scene_name, image_path)
+            return image_path
+
+        # Cache miss - refresh and try again
         _LOGGER.debug("Cache miss for scene '%s', refreshing options", scene_name)
         await self._async_refresh_options()
 
-        if scene_name in self._scene_to_path:
-            image_path = self._scene_to_path[scene_name]
-            if image_path.exists():
-                return image_path
+        image_path = self._lookup_scene_path(scene_name)
+        if image_path is not None:
+            return image_path
 
         _LOGGER.warning(
             "No image found for scene '%s' in %s",
@@ -573,6 +756,23 @@ class ChameleonSceneSelect(SelectEntity):
         )
         return None
 
+    def _lookup_scene_path(self, scene_name: str) -> str | None:
+        """Look up a scene's image path in the cached mapping.
+
+        Falls back to a case-insensitive match, so scene names passed by
+        automations or services in a different case still hit the cache.
+
+        Args:
+            scene_name: Scene name as selected or passed in
+
+        Returns:
+            The cached image path, or None if the scene is not cached
+        """
+        image_path = self._scene_to_path.get(scene_name)
+        if image_path is None:
+            image_path = self._scene_to_path_lower.get(scene_name.lower())
+        return image_path
+
     async def _turn_off_lights(self) -> None:
         """Turn off all configured lights.
 
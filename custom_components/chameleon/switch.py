@@ -18,7 +18,7 @@ from .const import (
     DEFAULT_SYNC_ANIMATION,
     DOMAIN,
 )
-from .helpers import get_chameleon_device_name, get_entity_base_name
+from .helpers import get_chameleon_device_info, get_entity_base_name
 
 if TYPE_CHECKING:
     from .animations import AnimationManager
@@ -68,12 +68,17 @@ class ChameleonAnimationSwitch(SwitchEntity):
         """Initialize the animation switch entity."""
         self.hass = hass
         self._entry = entry
+        # Runtime settings shared with the select entity; created by async_setup_entry
+        self._entry_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {})
         self._light_entities = light_entities
         self._is_on = initial_state
+        # Animation manager shared by all entries (created in async_setup_entry)
+        self._animation_manager: AnimationManager | None = hass.data.get(DOMAIN, {}).get("animation_manager")
 
         # Generate unique ID and entity ID with chameleon_ prefix
         base_name = get_entity_base_name(hass, light_entities)
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_animation"
+        self._attr_device_info = get_chameleon_device_info(hass, entry.entry_id, light_entities)
         self.entity_id = f"switch.chameleon_{base_name}_animation"
 
         _LOGGER.debug(
@@ -84,18 +89,8 @@ class ChameleonAnimationSwitch(SwitchEntity):
         )
 
     def _get_animation_manager(self) -> AnimationManager | None:
-        """Get the AnimationManager from hass.data."""
-        return self.hass.data.get(DOMAIN, {}).get("animation_manager")
-
-    @property
-    def device_info(self):
-        """Return device info for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": get_chameleon_device_name(self.hass, self._light_entities),
-            "manufacturer": "Chameleon",
-            "model": "Scene Selector",
-        }
+        """Get the shared AnimationManager looked up at init."""
+        return self._animation_manager
 
     @property
     def is_on(self) -> bool:
@@ -127,12 +122,7 @@ class ChameleonAnimationSwitch(SwitchEntity):
 
     def _store_animation_state(self) -> None:
         """Store the animation state in hass.data for other entities to access."""
-        if DOMAIN not in self.hass.data:
-            self.hass.data[DOMAIN] = {}
-        if self._entry.entry_id not in self.hass.data[DOMAIN]:
-            self.hass.data[DOMAIN][self._entry.entry_id] = {}
-
-        self.hass.data[DOMAIN][self._entry.entry_id]["animation_enabled"] = self._is_on
+        self._entry_data["animation_enabled"] = self._is_on
 
     async def _stop_animations(self) -> None:
         """Stop animations for all lights managed by this entity."""
@@ -174,12 +164,15 @@ class ChameleonSyncAnimationSwitch(SwitchEntity):
         """Initialize the sync animation switch entity."""
         self.hass = hass
         self._entry = entry
+        # Runtime settings shared with the select entity; created by async_setup_entry
+        self._entry_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {}).setdefault(entry.entry_id, {})
         self._light_entities = light_entities
         self._is_on = DEFAULT_SYNC_ANIMATION  # Default to staggered mode
 
         # Generate unique ID and entity ID with chameleon_ prefix
         base_name = get_entity_base_name(hass, light_entities)
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_sync_animation"
+        self._attr_device_info = get_chameleon_device_info(hass, entry.entry_id, light_entities)
         self.entity_id = f"switch.chameleon_{base_name}_sync_animation"
 
         _LOGGER.debug(
@@ -189,16 +182,6 @@ class ChameleonSyncAnimationSwitch(SwitchEntity):
             self._is_on,
         )
 
-    @property
-    def device_info(self):
-        """Return device info for this entity."""
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": get_chameleon_device_name(self.hass, self._light_entities),
-            "manufacturer": "Chameleon",
-            "model": "Scene Selector",
-        }
-
     @property
     def is_on(self) -> bool:
         """Return true if sync mode is enabled (all lights animate together)."""
@@ -226,12 +209,7 @@ class ChameleonSyncAnimationSwitch(SwitchEntity):
 
     def _store_sync_state(self) -> None:
         """Store the sync state in hass.data for other entities to access."""
-        if DOMAIN not in self.hass.data:
-            self.hass.data[DOMAIN] = {}
-        if self._entry.entry_id not in self.hass.data[DOMAIN]:
-            self.hass.data[DOMAIN][self._entry.entry_id] = {}
-
-        self.hass.data[DOMAIN][self._entry.entry_id]["sync_animation"] = self._is_on
+        self._entry_data["sync_animation"] = self._is_on
 
     @property
     def extra_state_attributes(self):
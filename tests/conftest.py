@@ -20,6 +20,7 @@ def _setup_homeassistant_mocks():
     mock_ha_components_light = MagicMock()
     mock_ha_config_entries = MagicMock()
     mock_ha_data_entry_flow = MagicMock()
+    mock_ha_exceptions = MagicMock()
     mock_ha_helpers = MagicMock()
     mock_ha_helpers_entity_platform = MagicMock()
     mock_ha_helpers_event = MagicMock()
@@ -185,6 +186,12 @@ def _setup_homeassistant_mocks():
     mock_ha_helpers_selector.NumberSelectorConfig = NumberSelectorConfig
     mock_ha_helpers_selector.NumberSelectorMode = NumberSelectorMode
 
+    # Exception classes must be real so they can be raised and caught
+    class HomeAssistantError(Exception):
+        pass
+
+    mock_ha_exceptions.HomeAssistantError = HomeAssistantError
+
     # Config validation mocks
     mock_ha_helpers_cv.entity_ids = MagicMock
     mock_ha_helpers_cv.string = MagicMock
@@ -198,6 +205,7 @@ def _setup_homeassistant_mocks():
     sys.modules["homeassistant.components.select"] = mock_ha_components_select
     sys.modules["homeassistant.config_entries"] = mock_ha_config_entries
     sys.modules["homeassistant.data_entry_flow"] = mock_ha_data_entry_flow
+    sys.modules["homeassistant.exceptions"] = mock_ha_exceptions
     sys.modules["homeassistant.helpers"] = mock_ha_helpers
     sys.modules["homeassistant.helpers.entity_platform"] = mock_ha_helpers_entity_platform
     sys.modules["homeassistant.helpers.event"] = mock_ha_helpers_event
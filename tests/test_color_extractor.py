@@ -2,12 +2,73 @@
 
 from __future__ import annotations
 
+import colorsys
+import json
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
 import pytest
+from PIL import Image
 
 from custom_components.chameleon.color_extractor import (
+    _sync_extract_dominant_color,
+    _sync_extract_palette,
+    async_load_color_cache,
+    async_unload_color_cache,
+    extract_dominant_color,
+    generate_gradient_array,
     generate_gradient_path,
     rgb_to_hs,
+    rgb_to_hs_batch,
 )
+from custom_components.chameleon.const import DOMAIN
+
+
+def _save_stripes(path, stripes):
+    """Save a PNG of vertical (color, width) stripes and return its path."""
+    image = Image.new("RGB", (sum(width for _, width in stripes), 50))
+    x = 0
+    for color, width in stripes:
+        image.paste(color, (x, 0, x + width, 50))
+        x += width
+    image.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def memory_store(monkeypatch):
+    """Replace the HA Store with one that keeps its JSON in memory."""
+
+    class MemoryStore:
+        """Store stand-in; saves are written immediately, as JSON."""
+
+        data = None
+
+        def __init__(self, hass, version, key):
+            pass
+
+        async def async_load(self):
+            return MemoryStore.data
+
+        def async_delay_save(self, data_func, delay):
+            MemoryStore.data = json.loads(json.dumps(data_func()))
+
+        async def async_save(self, data):
+            MemoryStore.data = json.loads(json.dumps(data))
+
+    monkeypatch.setitem(sys.modules, "homeassistant.helpers.storage", SimpleNamespace(Store=MemoryStore))
+    return MemoryStore
+
+
+@pytest.fixture
+def extractor_hass(hass):
+    """Mock hass whose executor jobs run inline."""
+    hass.data = {}
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    return hass
 
 
 class TestGenerateGradientPath:
@@ -70,6 +131,23 @@ class TestGenerateGradientPath:
             assert 0 <= b <= 255
 
 
+class TestGenerateGradientArray:
+    """Tests for generate_gradient_array function."""
+
+    def test_matches_gradient_path(self):
+        """Test that the packed array holds the same path as the list version."""
+        colors = [(255, 128, 0), (0, 64, 255), (10, 200, 30)]
+        result = generate_gradient_array(np.array(colors, dtype=np.uint8), steps_between=7)
+
+        assert result.dtype == np.uint8
+        assert result.shape == (21, 3)
+        assert list(map(tuple, result.tolist())) == generate_gradient_path(colors, steps_between=7)
+
+    def test_empty_colors(self):
+        """Test with empty color list."""
+        assert generate_gradient_array([]).shape == (0, 3)
+
+
 class TestRgbToHs:
     """Tests for rgb_to_hs function."""
 
@@ -131,3 +209,103 @@ class TestRgbToHs:
         hue, sat = rgb_to_hs((255, 128, 128))
         assert hue == pytest.approx(0, abs=1)  # Still red hue
         assert 40 < sat < 60  # Approximately 50% saturation
+
+
+class TestRgbToHsBatch:
+    """Tests for rgb_to_hs_batch function."""
+
+    def test_matches_colorsys(self):
+        """Test that every row matches colorsys for the same color."""
+        colors = [
+            (255, 0, 0),
+            (0, 255, 0),
+            (0, 0, 255),
+            (255, 0, 255),
+            (255, 255, 255),
+            (0, 0, 0),
+            (128, 128, 128),
+            (255, 128, 128),
+            (12, 200, 97),
+        ]
+        result = rgb_to_hs_batch(colors)
+        assert result.shape == (len(colors), 2)
+        for color, (hue, sat) in zip(colors, result.tolist(), strict=True):
+            expected_hue, expected_sat, _value = colorsys.rgb_to_hsv(*(channel / 255 for channel in color))
+            assert hue == pytest.approx(expected_hue * 360)
+            assert sat == pytest.approx(expected_sat * 100)
+
+    def test_empty_colors(self):
+        """Test with empty color list."""
+        assert rgb_to_hs_batch([]).shape == (0, 2)
+
+
+class TestColorCachePersistence:
+    """Tests for the stored extraction cache."""
+
+    @pytest.mark.asyncio
+    async def test_reload_hits_stored_result(self, extractor_hass, memory_store, tmp_path):
+        """Test that a result stored before unloading is a cache hit after reloading."""
+        image_path = _save_stripes(tmp_path / "beach.png", [((255, 0, 0), 100)])
+
+        await async_load_color_cache(extractor_hass)
+        assert await extract_dominant_color(extractor_hass, image_path) == (255, 0, 0)
+        await async_unload_color_cache(extractor_hass)
+        assert "palette_cache" not in extractor_hass.data[DOMAIN]
+        assert memory_store.data
+
+        await async_load_color_cache(extractor_hass)
+        with patch("custom_components.chameleon.color_extractor._sync_extract_dominant_color") as extract:
+            assert await extract_dominant_color(extractor_hass, image_path) == (255, 0, 0)
+        extract.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_edited_image_misses_stored_result(self, extractor_hass, memory_store, tmp_path):
+        """Test that a stored result is not used once its image has changed."""
+        image_path = _save_stripes(tmp_path / "beach.png", [((255, 0, 0), 100)])
+
+        await async_load_color_cache(extractor_hass)
+        assert await extract_dominant_color(extractor_hass, image_path) == (255, 0, 0)
+        await async_unload_color_cache(extractor_hass)
+
+        # Same name, new content and mtime
+        mtime_ns = os.stat(image_path).st_mtime_ns
+        _save_stripes(image_path, [((0, 0, 255), 120)])
+        os.utime(image_path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+        await async_load_color_cache(extractor_hass)
+        assert await extract_dominant_color(extractor_hass, image_path) == (0, 0, 255)
+
+
+class TestSyncExtractPalette:
+    """Tests for palette extraction from synthetic images."""
+
+    def test_colors_most_common_first(self, tmp_path):
+        """Test that each stripe color is found, ordered by area."""
+        image_path = _save_stripes(tmp_path / "stripes.png", [((0, 0, 255), 30), ((255, 0, 0), 60), ((0, 255, 0), 10)])
+
+        assert _sync_extract_palette(image_path, 3, 10) == [(255, 0, 0), (0, 0, 255), (0, 255, 0)]
+
+    def test_fewer_colors_than_requested(self, tmp_path):
+        """Test that a solid image yields just its one color."""
+        image_path = _save_stripes(tmp_path / "solid.png", [((12, 200, 97), 40)])
+
+        assert _sync_extract_palette(image_path, 5, 10) == [(12, 200, 97)]
+
+
+class TestSyncExtractDominantColor:
+    """Tests for dominant color extraction from synthetic images."""
+
+    def test_largest_area_wins(self, tmp_path):
+        """Test that the color covering the most pixels is dominant."""
+        image_path = _save_stripes(tmp_path / "stripes.png", [((0, 0, 255), 30), ((255, 0, 0), 60), ((0, 255, 0), 10)])
+
+        assert _sync_extract_dominant_color(image_path, 10) == (255, 0, 0)
+
+    def test_near_identical_shades_counted_together(self, tmp_path):
+        """Test that close shades share a histogram bin and outweigh a larger distinct color."""
+        image_path = _save_stripes(
+            tmp_path / "shades.png",
+            [((200, 40, 40), 30), ((202, 42, 41), 30), ((0, 0, 255), 40)],
+        )
+
+        assert _sync_extract_dominant_color(image_path, 10) == (201, 41, 40)
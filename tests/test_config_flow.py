@@ -189,3 +189,24 @@ class TestChameleonConfigFlow:
 
         name = flow._get_light_name("light.kitchen_strip")
         assert name == "Kitchen Strip"
+
+    @pytest.mark.asyncio
+    async def test_unique_id_ignores_light_order(self, hass: MagicMock):
+        """Test that the unique ID is a short digest independent of selection order."""
+        from custom_components.chameleon.config_flow import ChameleonConfigFlow
+
+        unique_ids = []
+        for light_entities in (["light.one", "light.two"], ["light.two", "light.one"]):
+            flow = ChameleonConfigFlow()
+            _setup_config_flow(flow, hass)
+            await flow.async_step_user(
+                user_input={
+                    CONF_LIGHT_ENTITIES: light_entities,
+                    CONF_ANIMATION_ENABLED: False,
+                    CONF_ANIMATION_SPEED: 5,
+                }
+            )
+            unique_ids.append(flow.async_set_unique_id.await_args.args[0])
+
+        assert unique_ids[0] == unique_ids[1]
+        assert len(unique_ids[0]) == 16
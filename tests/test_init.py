@@ -0,0 +1,76 @@
+"""Tests for the integration setup module."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.chameleon import async_migrate_entry
+from custom_components.chameleon.const import (
+    CONF_LIGHT_ENTITIES,
+    CONF_LIGHT_ENTITY,
+    CONFIG_ENTRY_MINOR_VERSION,
+    CONFIG_ENTRY_VERSION,
+)
+from custom_components.chameleon.helpers import get_entry_unique_id
+
+
+def _mock_entry(version: int, minor_version: int, data: dict) -> MagicMock:
+    """Create a mock config entry at the given version."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.version = version
+    entry.minor_version = minor_version
+    entry.data = data
+    return entry
+
+
+class TestAsyncMigrateEntry:
+    """Tests for async_migrate_entry."""
+
+    @pytest.mark.asyncio
+    async def test_migrates_single_light_entry(self, hass):
+        """Test that a version 1 entry gets the digest unique ID of its light."""
+        entry = _mock_entry(1, 1, {CONF_LIGHT_ENTITY: "light.living_room"})
+
+        assert await async_migrate_entry(hass, entry) is True
+
+        hass.config_entries.async_update_entry.assert_called_once_with(
+            entry,
+            unique_id=get_entry_unique_id(["light.living_room"]),
+            version=CONFIG_ENTRY_VERSION,
+            minor_version=CONFIG_ENTRY_MINOR_VERSION,
+        )
+
+    @pytest.mark.asyncio
+    async def test_migrates_multi_light_entry(self, hass):
+        """Test that a version 2.1 entry gets the digest unique ID of all its lights."""
+        entry = _mock_entry(2, 1, {CONF_LIGHT_ENTITIES: ["light.two", "light.one"]})
+
+        assert await async_migrate_entry(hass, entry) is True
+
+        hass.config_entries.async_update_entry.assert_called_once_with(
+            entry,
+            unique_id=get_entry_unique_id(["light.one", "light.two"]),
+            version=CONFIG_ENTRY_VERSION,
+            minor_version=CONFIG_ENTRY_MINOR_VERSION,
+        )
+
+    @pytest.mark.asyncio
+    async def test_current_entry_unchanged(self, hass):
+        """Test that an entry at the current version is left alone."""
+        entry = _mock_entry(CONFIG_ENTRY_VERSION, CONFIG_ENTRY_MINOR_VERSION, {CONF_LIGHT_ENTITIES: ["light.one"]})
+
+        assert await async_migrate_entry(hass, entry) is True
+
+        hass.config_entries.async_update_entry.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejects_future_version(self, hass):
+        """Test that an entry from a newer version is not migrated."""
+        entry = _mock_entry(CONFIG_ENTRY_VERSION + 1, 1, {CONF_LIGHT_ENTITIES: ["light.one"]})
+
+        assert await async_migrate_entry(hass, entry) is False
+
+        hass.config_entries.async_update_entry.assert_not_called()
@@ -120,6 +120,21 @@ class TestApplyColorsResult:
         assert "light.two" in failed
         assert failed["light.two"] == "Device offline"
 
+    def test_add_updates_counts(self):
+        """Test that adding results keeps the counts current."""
+        result = ApplyColorsResult()
+        assert result.succeeded_count == 0
+        assert result.failed_count == 0
+
+        result.add(LightResult("light.one", True, (255, 0, 0)))
+        assert result.all_succeeded is True
+
+        result.extend([LightResult("light.two", False, error=LightError.UNAVAILABLE)])
+        assert result.partial_failure is True
+        assert result.succeeded_count == 1
+        assert result.failed_count == 1
+        assert len(result.results) == 2
+
 
 class TestLightController:
     """Tests for LightController class."""
@@ -257,3 +272,48 @@ class TestLightController:
         assert result.partial_failure is True
         assert result.succeeded_count == 1
         assert result.failed_count == 1
+
+    @pytest.mark.asyncio
+    async def test_apply_colors_to_lights_groups_same_color(self, hass, mock_light_state):
+        """Test that lights sharing a color are updated with one service call."""
+        hass.states.get.return_value = mock_light_state
+        hass.services.async_call = AsyncMock()
+
+        controller = LightController(hass)
+        result = await controller.apply_colors_to_lights(
+            {
+                "light.one": (255, 0, 0),
+                "light.two": (0, 255, 0),
+                "light.three": (255, 0, 0),
+            }
+        )
+
+        assert [r.entity_id for r in result.results] == ["light.one", "light.two", "light.three"]
+        assert result.succeeded_count == 3
+        assert hass.services.async_call.call_count == 2
+        targets = [call.args[2]["entity_id"] for call in hass.services.async_call.call_args_list]
+        assert ["light.one", "light.three"] in targets
+
+    @pytest.mark.asyncio
+    async def test_apply_colors_to_lights_group_failure_retries_each_light(self, hass, mock_light_state):
+        """Test that a failed shared-color call is retried per light."""
+        hass.states.get.return_value = mock_light_state
+
+        async def turn_on(domain, service, data, blocking):
+            if "light.two" in data["entity_id"]:
+                raise Exception("Device offline")
+
+        hass.services.async_call = AsyncMock(side_effect=turn_on)
+
+        controller = LightController(hass)
+        result = await controller.apply_colors_to_lights(
+            {
+                "light.one": (255, 0, 0),
+                "light.two": (255, 0, 0),
+            }
+        )
+
+        assert result.partial_failure is True
+        assert result.applied_colors == {"light.one": (255, 0, 0)}
+        assert list(result.failed_lights) == ["light.two"]
+        assert "Device offline" in result.failed_lights["light.two"]